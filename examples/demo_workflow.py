@@ -3,20 +3,209 @@
 Demo workflow for the OCI MCP Server
 This script demonstrates how to use the MCP server to analyze requirements and provision resources
 """
-import json
-import os
+import argparse
 import sys
 import uuid
+from pathlib import Path
+from types import MappingProxyType
 
-# Add the parent directory to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import orjson
 import requests
-from src.api.schemas import ChatbotRequest, ConversationMessage, ProvisioningConfirmation
+from requests.adapters import HTTPAdapter
+from src.api.schemas import (
+    ChatbotRequest,
+    ConversationMessage,
+    ProvisioningConfirmation,
+    WorkflowRequest,
+)
 
 # Configuration
 MCP_SERVER_URL = "http://localhost:8000"
 
+# Shared HTTP session so every call to the MCP server reuses pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+})
+
+# Mock responses returned when the MCP server cannot be reached
+_MOCK_ANALYSIS = MappingProxyType({
+    "recommendations": [
+        {
+            "resource_type": "compute",
+            "name": "WebServer",
+            "description": "Compute instance for hosting the website",
+            "specifications": {
+                "shape": "VM.Standard.E2.1.Micro",
+                "ocpus": 1,
+                "memory_in_gbs": 1,
+                "instance_count": 1,
+                "image_id": "Oracle-Linux-8.6-2022.05.31-0",
+            },
+            "estimated_cost": {
+                "monthly": 50.0,
+                "currency": "USD",
+            },
+        },
+        {
+            "resource_type": "network",
+            "name": "WebsiteVCN",
+            "description": "Virtual Cloud Network for the website",
+            "specifications": {
+                "vcn_cidr": "10.0.0.0/16",
+                "subnet_cidr": "10.0.0.0/24",
+                "security_list_rules": [
+                    {"protocol": "6", "port": 80, "source": "0.0.0.0/0"},
+                    {"protocol": "6", "port": 443, "source": "0.0.0.0/0"},
+                    {"protocol": "6", "port": 22, "source": "0.0.0.0/0"},
+                ],
+            },
+            "estimated_cost": {
+                "monthly": 0.0,
+                "currency": "USD",
+            },
+        },
+        {
+            "resource_type": "database",
+            "name": "WebsiteDB",
+            "description": "Database for the website",
+            "specifications": {
+                "type": "autonomous",
+                "workload_type": "OLTP",
+                "storage_in_tbs": 1,
+                "cpu_core_count": 1,
+            },
+            "estimated_cost": {
+                "monthly": 900.0,
+                "currency": "USD",
+            },
+            "dependencies": ["WebsiteVCN"],
+        },
+        {
+            "resource_type": "storage",
+            "name": "WebsiteStorage",
+            "description": "Block volume for the website",
+            "specifications": {
+                "size_in_gbs": 50,
+                "vpus_per_gb": 10,
+            },
+            "estimated_cost": {
+                "monthly": 1.28,
+                "currency": "USD",
+            },
+            "dependencies": ["WebServer"],
+        },
+    ],
+    "message": "Resource analysis completed successfully",
+})
+
+_MOCK_PROVISIONING = MappingProxyType({
+    "status": "success",
+    "provisioned_resources": [
+        {
+            "resource_type": "compute",
+            "name": "WebServer",
+            "ocid": "ocid1.instance.oc1..example",
+            "status": "active",
+            "details": {
+                "shape": "VM.Standard.E2.1.Micro",
+                "availability_domain": "AD-1",
+                "fault_domain": "FAULT-DOMAIN-1",
+                "time_created": "2023-10-25T12:34:56.789Z",
+            },
+            "access_info": {
+                "public_ip": "10.0.0.123",
+                "private_ip": "192.168.0.123",
+                "hostname": "webserver.example.com",
+            },
+        },
+        # Other resources would be included here
+    ],
+    "message": "Resources provisioned successfully",
+})
+
+_MOCK_STATUS = MappingProxyType({
+    "status": "completed",
+    "progress": 100.0,
+    "resources": [
+        {
+            "name": "WebServer",
+            "type": "compute",
+            "status": "active",
+            "ocid": "ocid1.instance.oc1..example",
+        },
+        {
+            "name": "WebsiteVCN",
+            "type": "network",
+            "status": "active",
+            "ocid": "ocid1.vcn.oc1..example",
+        },
+        {
+            "name": "WebsiteDB",
+            "type": "database",
+            "status": "active",
+            "ocid": "ocid1.autonomousdatabase.oc1..example",
+        },
+        {
+            "name": "WebsiteStorage",
+            "type": "storage",
+            "status": "active",
+            "ocid": "ocid1.volume.oc1..example",
+        },
+    ],
+    "started_at": "2023-10-25T12:34:56.789Z",
+    "estimated_completion": "2023-10-25T12:49:56.789Z",
+    "message": "Provisioning completed successfully",
+})
+
+_MOCK_WORKFLOW = MappingProxyType({
+    "status": "success",
+    "recommendations": [
+        {
+            "resource_type": "compute",
+            "name": "WebServer",
+            "description": "Compute instance for hosting the website",
+            "specifications": {
+                "shape": "VM.Standard.E2.1.Micro",
+                "ocpus": 1,
+                "memory_in_gbs": 1,
+                "instance_count": 1,
+            },
+            "estimated_cost": {
+                "monthly": 50.0,
+                "currency": "USD",
+            },
+        },
+        # Other resources would be included here
+    ],
+    "provisioned_resources": [
+        {
+            "resource_type": "compute",
+            "name": "WebServer",
+            "ocid": "ocid1.instance.oc1..example",
+            "status": "active",
+            "details": {
+                "shape": "VM.Standard.E2.1.Micro",
+                "time_created": "2023-10-25T12:34:56.789Z",
+            },
+        },
+        # Other resources would be included here
+    ],
+    "message": "Resources analyzed and provisioned successfully",
+})
+
+
+def pretty_json(data):
+    """Format data as indented JSON using orjson"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
 
 def print_section(title):
     """Print a section title"""
@@ -73,7 +262,7 @@ def analyze_requirements(conversation):
     print_section("Analyzing Requirements")
     
     # Create a request ID
-    request_id = str(uuid.uuid4())
+    request_id = uuid.uuid4().hex
     print(f"Request ID: {request_id}")
     
     # Create the request
@@ -86,100 +275,32 @@ def analyze_requirements(conversation):
         }
     )
     
-    # Convert to JSON for printing
-    request_json = json.loads(request.json())
+    # Serialize the payload with orjson and send the bytes as-is
+    request_data = request.model_dump()
+    body = orjson.dumps(request_data)
     print("\nSending request to MCP server:")
-    print(json.dumps(request_json, indent=2))
+    print(pretty_json(request_data))
     
     try:
         # Send the request to the MCP server
-        response = requests.post(
+        response = SESSION.post(
             f"{MCP_SERVER_URL}/api/analyze",
-            json=request_json,
+            data=body,
         )
         
         # Check if the request was successful
         response.raise_for_status()
         
         # Parse the response
-        result = response.json()
+        result = orjson.loads(response.content)
         print("\nReceived recommendations from MCP server:")
-        print(json.dumps(result, indent=2))
+        print(pretty_json(result))
         
         return result
     except requests.exceptions.RequestException as e:
         print(f"\nError sending request to MCP server: {str(e)}")
         # For demonstration purposes, return a mock response
-        return {
-            "request_id": request_id,
-            "recommendations": [
-                {
-                    "resource_type": "compute",
-                    "name": "WebServer",
-                    "description": "Compute instance for hosting the website",
-                    "specifications": {
-                        "shape": "VM.Standard.E2.1.Micro",
-                        "ocpus": 1,
-                        "memory_in_gbs": 1,
-                        "instance_count": 1,
-                        "image_id": "Oracle-Linux-8.6-2022.05.31-0",
-                    },
-                    "estimated_cost": {
-                        "monthly": 50.0,
-                        "currency": "USD",
-                    },
-                },
-                {
-                    "resource_type": "network",
-                    "name": "WebsiteVCN",
-                    "description": "Virtual Cloud Network for the website",
-                    "specifications": {
-                        "vcn_cidr": "10.0.0.0/16",
-                        "subnet_cidr": "10.0.0.0/24",
-                        "security_list_rules": [
-                            {"protocol": "6", "port": 80, "source": "0.0.0.0/0"},
-                            {"protocol": "6", "port": 443, "source": "0.0.0.0/0"},
-                            {"protocol": "6", "port": 22, "source": "0.0.0.0/0"},
-                        ],
-                    },
-                    "estimated_cost": {
-                        "monthly": 0.0,
-                        "currency": "USD",
-                    },
-                },
-                {
-                    "resource_type": "database",
-                    "name": "WebsiteDB",
-                    "description": "Database for the website",
-                    "specifications": {
-                        "type": "autonomous",
-                        "workload_type": "OLTP",
-                        "storage_in_tbs": 1,
-                        "cpu_core_count": 1,
-                    },
-                    "estimated_cost": {
-                        "monthly": 900.0,
-                        "currency": "USD",
-                    },
-                    "dependencies": ["WebsiteVCN"],
-                },
-                {
-                    "resource_type": "storage",
-                    "name": "WebsiteStorage",
-                    "description": "Block volume for the website",
-                    "specifications": {
-                        "size_in_gbs": 50,
-                        "vpus_per_gb": 10,
-                    },
-                    "estimated_cost": {
-                        "monthly": 1.28,
-                        "currency": "USD",
-                    },
-                    "dependencies": ["WebServer"],
-                },
-            ],
-            "message": "Resource analysis completed successfully",
-        }
+        return {"request_id": request_id, **_MOCK_ANALYSIS}
 
 
 def confirm_provisioning(analysis_result):
@@ -210,55 +331,32 @@ def confirm_provisioning(analysis_result):
         confirmed_resources=recommendations,
     )
     
-    # Convert to JSON for printing
-    confirmation_json = json.loads(confirmation.json())
+    # Serialize the payload with orjson and send the bytes as-is
+    confirmation_data = confirmation.model_dump()
+    body = orjson.dumps(confirmation_data)
     print("\nSending confirmation to MCP server:")
-    print(json.dumps(confirmation_json, indent=2))
+    print(pretty_json(confirmation_data))
     
     try:
         # Send the confirmation to the MCP server
-        response = requests.post(
+        response = SESSION.post(
             f"{MCP_SERVER_URL}/api/provision",
-            json=confirmation_json,
+            data=body,
         )
         
         # Check if the request was successful
         response.raise_for_status()
         
         # Parse the response
-        result = response.json()
+        result = orjson.loads(response.content)
         print("\nProvisioning initiated:")
-        print(json.dumps(result, indent=2))
+        print(pretty_json(result))
         
         return result
     except requests.exceptions.RequestException as e:
         print(f"\nError sending confirmation to MCP server: {str(e)}")
         # For demonstration purposes, return a mock response
-        return {
-            "request_id": request_id,
-            "status": "success",
-            "provisioned_resources": [
-                {
-                    "resource_type": "compute",
-                    "name": "WebServer",
-                    "ocid": "ocid1.instance.oc1..example",
-                    "status": "active",
-                    "details": {
-                        "shape": "VM.Standard.E2.1.Micro",
-                        "availability_domain": "AD-1",
-                        "fault_domain": "FAULT-DOMAIN-1",
-                        "time_created": "2023-10-25T12:34:56.789Z",
-                    },
-                    "access_info": {
-                        "public_ip": "10.0.0.123",
-                        "private_ip": "192.168.0.123",
-                        "hostname": "webserver.example.com",
-                    },
-                },
-                # Other resources would be included here
-            ],
-            "message": "Resources provisioned successfully",
-        }
+        return {"request_id": request_id, **_MOCK_PROVISIONING}
 
 
 def check_provisioning_status(provisioning_result):
@@ -270,72 +368,101 @@ def check_provisioning_status(provisioning_result):
     
     try:
         # Send the request to the MCP server
-        response = requests.get(f"{MCP_SERVER_URL}/api/status/{request_id}")
+        response = SESSION.get(f"{MCP_SERVER_URL}/api/status/{request_id}")
         
         # Check if the request was successful
         response.raise_for_status()
         
         # Parse the response
-        result = response.json()
+        result = orjson.loads(response.content)
         print("Provisioning status:")
-        print(json.dumps(result, indent=2))
+        print(pretty_json(result))
         
         return result
     except requests.exceptions.RequestException as e:
         print(f"\nError checking provisioning status: {str(e)}")
         # For demonstration purposes, return a mock response
-        return {
-            "request_id": request_id,
-            "status": "completed",
-            "progress": 100.0,
-            "resources": [
-                {
-                    "name": "WebServer",
-                    "type": "compute",
-                    "status": "active",
-                    "ocid": "ocid1.instance.oc1..example",
-                },
-                {
-                    "name": "WebsiteVCN",
-                    "type": "network",
-                    "status": "active",
-                    "ocid": "ocid1.vcn.oc1..example",
-                },
-                {
-                    "name": "WebsiteDB",
-                    "type": "database",
-                    "status": "active",
-                    "ocid": "ocid1.autonomousdatabase.oc1..example",
-                },
-                {
-                    "name": "WebsiteStorage",
-                    "type": "storage",
-                    "status": "active",
-                    "ocid": "ocid1.volume.oc1..example",
-                },
-            ],
-            "started_at": "2023-10-25T12:34:56.789Z",
-            "estimated_completion": "2023-10-25T12:49:56.789Z",
-            "message": "Provisioning completed successfully",
-        }
+        return {"request_id": request_id, **_MOCK_STATUS}
+
+
+def run_workflow(conversation):
+    """Analyze requirements and provision resources with a single request"""
+    print_section("Running Combined Workflow")
+    
+    # Create a request ID
+    request_id = uuid.uuid4().hex
+    print(f"Request ID: {request_id}")
+    
+    # Create the request, confirming the recommendations up front
+    request = WorkflowRequest(
+        request_id=request_id,
+        conversation_context=conversation,
+        user_preferences={
+            "cost_optimization": "high",
+            "region_preference": "us-ashburn-1",
+        },
+        auto_confirm=True,
+    )
+    
+    # Serialize the payload with orjson and send the bytes as-is
+    request_data = request.model_dump()
+    body = orjson.dumps(request_data)
+    print("\nSending workflow request to MCP server:")
+    print(pretty_json(request_data))
+    
+    try:
+        # Send the request to the MCP server
+        response = SESSION.post(
+            f"{MCP_SERVER_URL}/api/workflow",
+            data=body,
+        )
+        
+        # Check if the request was successful
+        response.raise_for_status()
+        
+        # Parse the response
+        result = orjson.loads(response.content)
+        print("\nReceived workflow result from MCP server:")
+        print(pretty_json(result))
+        
+        return result
+    except requests.exceptions.RequestException as e:
+        print(f"\nError sending workflow request to MCP server: {str(e)}")
+        # For demonstration purposes, return a mock response
+        return {"request_id": request_id, **_MOCK_WORKFLOW}
 
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="OCI MCP Server demo workflow")
+    parser.add_argument(
+        "--step-by-step",
+        action="store_true",
+        help="Call /api/analyze, /api/provision and /api/status separately instead of /api/workflow",
+    )
+    args = parser.parse_args()
+    
     print_section("OCI MCP Server Demo Workflow")
     print("This script demonstrates how to use the MCP server to analyze requirements and provision resources.")
     
-    # Step 1: Simulate a conversation
-    conversation = simulate_conversation()
-    
-    # Step 2: Analyze requirements
-    analysis_result = analyze_requirements(conversation)
-    
-    # Step 3: Confirm provisioning
-    provisioning_result = confirm_provisioning(analysis_result)
-    
-    # Step 4: Check provisioning status
-    status_result = check_provisioning_status(provisioning_result)
+    try:
+        # Step 1: Simulate a conversation
+        conversation = simulate_conversation()
+        
+        if args.step_by_step:
+            # Step 2: Analyze requirements
+            analysis_result = analyze_requirements(conversation)
+            
+            # Step 3: Confirm provisioning
+            provisioning_result = confirm_provisioning(analysis_result)
+            
+            # Step 4: Check provisioning status
+            status_result = check_provisioning_status(provisioning_result)
+        else:
+            # Step 2: Analyze and provision in a single round trip
+            run_workflow(conversation)
+    finally:
+        SESSION.close()
     
     print_section("Demo Completed")
     print("The demo workflow has completed successfully.")
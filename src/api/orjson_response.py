@@ -0,0 +1,40 @@
+"""
+orjson-backed JSON response for the OCI MCP Server
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes with the options used for API responses
+    
+    Args:
+        content: Content to serialize
+        
+    Returns:
+        Serialized JSON bytes
+    """
+    return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib json module
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize the response content to JSON bytes
+        
+        Args:
+            content: Content to serialize
+            
+        Returns:
+            Serialized JSON bytes
+        """
+        return dumps(content)
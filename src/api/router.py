@@ -1,34 +1,141 @@
 """
 API Router for the OCI MCP Server
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import hmac
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from pydantic import BaseModel
+
+from api.orjson_response import ORJSONResponse, dumps
 from api.schemas import (
     ChatbotRequest,
     ProvisioningConfirmation,
     ProvisioningResponse,
     ResourceRecommendation,
+    WorkflowRequest,
+    WorkflowResponse,
 )
 from core.analyzer import ResourceAnalyzer
 from core.provisioner import ResourceProvisioner
-from services.oci_client import OCIClient
+from services.oci_client import DEFAULT_COMPUTE_SHAPES, OCIClient
 
 router = APIRouter()
 
+# Catalog responses are cached as serialized JSON for this many seconds
+CATALOG_CACHE_TTL_SECONDS = 3600
+
+_catalog_cache: Dict[str, Tuple[float, bytes]] = {}
+_catalog_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _shared_oci_client() -> OCIClient:
+    """Create the OCI client shared by all requests; failures are retried on the next call"""
+    return OCIClient()
+
+
+def get_oci_client() -> OCIClient:
+    """
+    Get the shared OCI client instance
+    
+    Dependencies are resolved before an endpoint's own error handling runs, so a
+    construction failure is raised here as a JSON 500 response.
+    """
+    try:
+        return _shared_oci_client()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error initializing OCI client: {str(e)}",
+        )
+
+
+@lru_cache(maxsize=None)
+def get_analyzer() -> ResourceAnalyzer:
+    """Get the shared resource analyzer instance"""
+    return ResourceAnalyzer()
+
+
+@lru_cache(maxsize=None)
+def get_provisioner() -> ResourceProvisioner:
+    """Get the shared resource provisioner instance"""
+    return ResourceProvisioner(oci_client=get_oci_client())
+
+
+def require_admin_token(request: Request, x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Reject requests that do not carry the admin token from security.admin_token
+    
+    Admin endpoints are disabled while no token is configured.
+    """
+    expected = getattr(request.app.state, "admin_token", None)
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled",
+        )
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+        )
+
+
+def _model_response(model: BaseModel) -> ORJSONResponse:
+    """
+    Render a response model directly, bypassing FastAPI's jsonable_encoder
+    
+    Unset and None fields are left out to keep the payload small.
+    """
+    return ORJSONResponse(
+        content=model.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+    )
+
 
-@router.post("/analyze", response_model=ResourceRecommendation)
-async def analyze_requirements(request: ChatbotRequest):
+def _cached_catalog_response(key: str, build: Callable[[], Tuple[Any, bool]]) -> Response:
+    """
+    Serve a catalog response from the serialized cache, rebuilding it once expired
+    
+    Args:
+        key: Cache key for the catalog
+        build: Callable producing the response content on a cache miss, and whether
+            that content may be cached
+        
+    Returns:
+        Response containing the JSON bytes
+    """
+    now = time.monotonic()
+    cached = _catalog_cache.get(key)
+    if cached is None or now - cached[0] >= CATALOG_CACHE_TTL_SECONDS:
+        with _catalog_cache_lock:
+            cached = _catalog_cache.get(key)
+            if cached is None or now - cached[0] >= CATALOG_CACHE_TTL_SECONDS:
+                content, cacheable = build()
+                cached = (now, dumps(content))
+                if cacheable:
+                    _catalog_cache[key] = cached
+    return Response(content=cached[1], media_type="application/json")
+
+
+@router.post("/analyze", responses={200: {"model": ResourceRecommendation}})
+def analyze_requirements(
+    request: ChatbotRequest, analyzer: ResourceAnalyzer = Depends(get_analyzer)
+):
     """
     Analyze user requirements from chatbot conversation and recommend OCI resources
     """
     try:
-        analyzer = ResourceAnalyzer()
-        recommendations = analyzer.analyze_requirements(request.conversation_context)
-        return ResourceRecommendation(
+        recommendations = analyzer.analyze_requirements(request.conversation_context_raw())
+        response = ResourceRecommendation(
             request_id=request.request_id,
             recommendations=recommendations,
             message="Resource analysis completed successfully",
         )
+        return _model_response(response)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -36,22 +143,25 @@ async def analyze_requirements(request: ChatbotRequest):
         )
 
 
-@router.post("/provision", response_model=ProvisioningResponse)
-async def provision_resources(confirmation: ProvisioningConfirmation):
+@router.post("/provision", responses={200: {"model": ProvisioningResponse}})
+def provision_resources(
+    confirmation: ProvisioningConfirmation,
+    provisioner: ResourceProvisioner = Depends(get_provisioner),
+):
     """
     Provision OCI resources based on confirmed recommendations
     """
     try:
-        provisioner = ResourceProvisioner()
         result = provisioner.provision_resources(
             confirmation.request_id, confirmation.confirmed_resources
         )
-        return ProvisioningResponse(
+        response = ProvisioningResponse(
             request_id=confirmation.request_id,
             status="success",
             provisioned_resources=result,
             message="Resources provisioned successfully",
         )
+        return _model_response(response)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -59,15 +169,51 @@ async def provision_resources(confirmation: ProvisioningConfirmation):
         )
 
 
+@router.post("/workflow", responses={200: {"model": WorkflowResponse}})
+def run_workflow(
+    request: WorkflowRequest,
+    analyzer: ResourceAnalyzer = Depends(get_analyzer),
+    provisioner: ResourceProvisioner = Depends(get_provisioner),
+):
+    """
+    Analyze requirements and provision the recommended resources in a single call
+    """
+    try:
+        recommendations = analyzer.analyze_requirements(request.conversation_context_raw())
+        if not request.auto_confirm:
+            response = WorkflowResponse(
+                request_id=request.request_id,
+                status="pending_confirmation",
+                recommendations=recommendations,
+                message="Resource analysis completed, awaiting confirmation",
+            )
+        else:
+            provisioned = provisioner.provision_resources(request.request_id, recommendations)
+            response = WorkflowResponse(
+                request_id=request.request_id,
+                status="success",
+                recommendations=recommendations,
+                provisioned_resources=provisioned,
+                message="Resources analyzed and provisioned successfully",
+            )
+        return _model_response(response)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error running workflow: {str(e)}",
+        )
+
+
 @router.get("/resource-types")
-async def get_resource_types():
+def get_resource_types(oci_client: OCIClient = Depends(get_oci_client)):
     """
     Get available OCI resource types that can be provisioned
     """
     try:
-        oci_client = OCIClient()
-        resource_types = oci_client.get_available_resource_types()
-        return {"resource_types": resource_types}
+        return _cached_catalog_response(
+            "resource_types",
+            lambda: ({"resource_types": oci_client.get_available_resource_types()}, True),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -76,14 +222,17 @@ async def get_resource_types():
 
 
 @router.get("/compute-shapes")
-async def get_compute_shapes():
+def get_compute_shapes(oci_client: OCIClient = Depends(get_oci_client)):
     """
     Get available OCI compute shapes
     """
+    def build():
+        compute_shapes = oci_client.get_compute_shapes()
+        # Never keep the demonstration fallback, so OCI is retried on the next request
+        return {"compute_shapes": compute_shapes}, compute_shapes is not DEFAULT_COMPUTE_SHAPES
+    
     try:
-        oci_client = OCIClient()
-        shapes = oci_client.get_compute_shapes()
-        return {"compute_shapes": shapes}
+        return _cached_catalog_response("compute_shapes", build)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,15 +240,28 @@ async def get_compute_shapes():
         )
 
 
+@router.post("/cache/invalidate", dependencies=[Depends(require_admin_token)])
+def invalidate_catalog_cache(oci_client: OCIClient = Depends(get_oci_client)):
+    """
+    Clear the cached resource type and compute shape catalogs
+    """
+    with _catalog_cache_lock:
+        _catalog_cache.clear()
+        # Also drop the client's shapes, or the next rebuild would reuse them
+        oci_client.clear_compute_shapes_cache()
+    return {"status": "cleared"}
+
+
 @router.get("/status/{request_id}")
-async def get_provisioning_status(request_id: str):
+def get_provisioning_status(
+    request_id: str, provisioner: ResourceProvisioner = Depends(get_provisioner)
+):
     """
     Get the status of a provisioning request
     """
     try:
-        provisioner = ResourceProvisioner()
-        status = provisioner.get_provisioning_status(request_id)
-        return status
+        provisioning_status = provisioner.get_provisioning_status(request_id)
+        return ORJSONResponse(content=provisioning_status)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2,9 +2,9 @@
 API Schemas for the OCI MCP Server
 """
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ResourceType(str, Enum):
@@ -27,8 +27,14 @@ class ResourceStatus(str, Enum):
     DELETED = "deleted"
 
 
+# Lightweight (role, content, timestamp) form of a ConversationMessage
+RawConversationMessage = Tuple[str, str, Optional[str]]
+
+
 class ConversationMessage(BaseModel):
     """Model for a single message in the conversation context"""
+    model_config = ConfigDict(frozen=True)
+
     role: str = Field(..., description="Role of the message sender (user or assistant)")
     content: str = Field(..., description="Content of the message")
     timestamp: Optional[str] = Field(None, description="Timestamp of the message")
@@ -36,7 +42,9 @@ class ConversationMessage(BaseModel):
 
 class ChatbotRequest(BaseModel):
     """Model for incoming requests from the chatbot"""
-    request_id: str = Field(..., description="Unique identifier for the request")
+    request_id: str = Field(
+        ..., description="Unique identifier for the request, e.g. a 32-character hex UUID"
+    )
     conversation_context: List[ConversationMessage] = Field(
         ..., description="List of conversation messages providing context"
     )
@@ -47,15 +55,30 @@ class ChatbotRequest(BaseModel):
         None, description="Existing OCI resources the user already has"
     )
 
+    def conversation_context_raw(self) -> Tuple[RawConversationMessage, ...]:
+        """Conversation context as (role, content, timestamp) tuples"""
+        return tuple(
+            (msg.role, msg.content, msg.timestamp) for msg in self.conversation_context
+        )
+
+
+class WorkflowRequest(ChatbotRequest):
+    """Model for a combined analyze-and-provision request from the chatbot"""
+    auto_confirm: bool = Field(
+        True, description="Provision the recommended resources without a separate confirmation"
+    )
+
 
 class OCIResource(BaseModel):
     """Model for an OCI resource recommendation or provisioned resource"""
+    model_config = ConfigDict(frozen=True)
+
     resource_type: ResourceType
     name: str
     description: Optional[str] = None
     specifications: Dict[str, Any]
     estimated_cost: Optional[Dict[str, Union[float, str]]] = None
-    dependencies: Optional[List[str]] = None
+    dependencies: List[str] = Field(default_factory=list)
 
 
 class ResourceRecommendation(BaseModel):
@@ -76,6 +99,8 @@ class ProvisioningConfirmation(BaseModel):
 
 class ProvisionedResource(BaseModel):
     """Model for a successfully provisioned resource"""
+    model_config = ConfigDict(frozen=True)
+
     resource_type: ResourceType
     name: str
     ocid: str  # Oracle Cloud Identifier
@@ -90,7 +115,16 @@ class ProvisioningResponse(BaseModel):
     status: str
     provisioned_resources: List[ProvisionedResource]
     message: str
-    errors: Optional[List[Dict[str, Any]]] = None
+    errors: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class WorkflowResponse(BaseModel):
+    """Model for the combined analyze-and-provision response"""
+    request_id: str
+    status: str
+    recommendations: List[OCIResource]
+    provisioned_resources: Optional[List[ProvisionedResource]] = None
+    message: str
 
 
 class ProvisioningStatusResponse(BaseModel):
@@ -3,13 +3,195 @@ Resource Analyzer for the OCI MCP Server
 """
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple, Union
 
-from api.schemas import ConversationMessage, OCIResource, ResourceType
+from api.schemas import ConversationMessage, OCIResource, RawConversationMessage, ResourceType
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+ConversationContext = Sequence[Union[ConversationMessage, RawConversationMessage]]
+
+# Security list rules applied to every network; copied per call, never handed out
+_DEFAULT_SEC_RULES = (
+    {"protocol": "6", "port": 80, "source": "0.0.0.0/0"},  # HTTP
+    {"protocol": "6", "port": 443, "source": "0.0.0.0/0"},  # HTTPS
+    {"protocol": "6", "port": 22, "source": "0.0.0.0/0"},  # SSH
+)
+
+# Rules used to extract requirements from conversation text, as (keywords, pattern, value).
+# A rule matches if any keyword is a substring of the lowercased text or the pattern
+# matches; patterns are only needed for whitespace runs and are compiled once at import.
+_WEBSITE_RULES = [
+    ((), re.compile(r"(static|simple)\s+(website|site|web\s+page)", re.IGNORECASE), "static"),
+    ((), re.compile(r"(dynamic|interactive)\s+(website|site|web\s+application)", re.IGNORECASE), "dynamic"),
+    (("e-commerce", "ecommerce", "shop"), re.compile(r"online\s+store", re.IGNORECASE), "ecommerce"),
+    (("blog", "cms"), re.compile(r"content\s+management", re.IGNORECASE), "blog"),
+    (("api", "backend", "service"), None, "api"),
+]
+
+_TRAFFIC_RULES = [
+    ((), re.compile(r"(low|small|minimal)\s+(traffic|visitors|users)", re.IGNORECASE), "low"),
+    ((), re.compile(r"(medium|moderate)\s+(traffic|visitors|users)", re.IGNORECASE), "medium"),
+    ((), re.compile(r"(high|large|heavy|substantial)\s+(traffic|visitors|users)", re.IGNORECASE), "high"),
+]
+
+_REGION_RULES = [
+    (("us", "america"), re.compile(r"united\s+states", re.IGNORECASE), "us"),
+    (("eu",), None, "eu"),  # also covers europe and european
+    (("asia", "apac"), None, "asia"),  # also covers asia pacific
+]
+
+_DATABASE_RULE = (("database", "db"), re.compile(r"data\s+storage", re.IGNORECASE), "database")
+_SQL_RULE = (("sql", "relational"), None, "relational")  # "sql" also covers mysql and postgresql
+_NOSQL_RULE = (("nosql", "mongodb", "document", "key-value"), None, "nosql")
+_AVAILABILITY_RULE = (
+    ("ha", "99.9"), re.compile(r"(high\s+availability|always\s+available)", re.IGNORECASE), "high"
+)
+_SCALING_RULE = (("scale", "scaling", "scalable", "grow", "expand"), None, "required")
+
+_STORAGE_RE = re.compile(r"(\d+)\s*(gb|tb|gigabytes|terabytes)", re.IGNORECASE)
+_BUDGET_RE = re.compile(r"budget\s+of\s+\$?(\d+)", re.IGNORECASE)
+
+# Shortest texts that can match the storage ("1gb") and budget ("budget of 1") patterns
+_STORAGE_MIN_LENGTH = 3
+_BUDGET_MIN_LENGTH = 11
+
+
+@dataclass(frozen=True)
+class ExtractedInfo:
+    """Key information extracted from a conversation"""
+    website_type: Optional[str] = None
+    expected_traffic: Optional[str] = None
+    database_needs: Optional[str] = None
+    storage_requirements: Optional[int] = None
+    performance_requirements: Optional[str] = None
+    budget_constraints: Optional[int] = None
+    security_requirements: Optional[str] = None
+    availability_requirements: Optional[str] = None
+    scaling_needs: Optional[str] = None
+    region_preferences: Optional[str] = None
+
+
+_EMPTY_EXTRACTED_INFO = ExtractedInfo()
+
+# Block volume size tiers in GB
+_MIN_BLOCK_VOLUME_GBS = 50
+_DYNAMIC_BLOCK_VOLUME_GBS = 100  # ecommerce and dynamic websites
+
+
+class _Costs:
+    """Monthly USD rates used for cost estimates"""
+    OCPU_MONTHLY = 50.0
+    LB_BASE_MONTHLY = 10.0
+    LB_MBPS_MONTHLY = 0.0017 * 730  # Hourly rate per Mbps over a 730-hour month
+    DB_CORE_MONTHLY = 900.0
+    BLOCK_GB_MONTHLY = 0.0255
+    OBJECT_STORAGE_MONTHLY = 0.0255 * 100  # Assuming 100GB of object storage
+
+# Number of distinct extracted information / requirement sets whose results are memoized
+REQUIREMENTS_CACHE_SIZE = 128
+RECOMMENDATIONS_CACHE_SIZE = 128
+
+
+_Rule = Tuple[Tuple[str, ...], Optional[Pattern[str]], str]
+
+
+def _match(rule: _Rule, text: str, lowered: str) -> Optional[str]:
+    """Return the rule's value if it matches the text, otherwise None"""
+    keywords, pattern, value = rule
+    if any(keyword in lowered for keyword in keywords) or (pattern is not None and pattern.search(text)):
+        return value
+    return None
+
+
+def _first_match(rules: List[_Rule], text: str, lowered: str) -> Optional[str]:
+    """Return the value of the first rule that matches the text"""
+    for rule in rules:
+        value = _match(rule, text, lowered)
+        if value is not None:
+            return value
+    return None
+
+
+@lru_cache(maxsize=256)
+def _extract_from_text(full_text: str) -> ExtractedInfo:
+    """
+    Extract key information from the combined conversation text
+    
+    Args:
+        full_text: Conversation messages joined into a single string
+        
+    Returns:
+        Extracted information
+    """
+    # Nothing to extract from an empty conversation
+    if not full_text or full_text.isspace():
+        return _EMPTY_EXTRACTED_INFO
+    
+    lowered = full_text.lower()
+    
+    # Extract database needs
+    database_needs = None
+    if _match(_DATABASE_RULE, full_text, lowered):
+        database_needs = (
+            _match(_SQL_RULE, full_text, lowered)
+            or _match(_NOSQL_RULE, full_text, lowered)
+            or "general"
+        )
+    
+    # Extract storage requirements
+    storage_requirements = None
+    storage_match = _STORAGE_RE.search(full_text) if len(full_text) >= _STORAGE_MIN_LENGTH else None
+    if storage_match:
+        storage_requirements = int(storage_match.group(1))
+        unit = storage_match.group(2).lower()
+        
+        if unit in ["tb", "terabytes"]:
+            storage_requirements *= 1024  # Convert to GB
+    
+    # Extract budget constraints
+    budget_match = _BUDGET_RE.search(full_text) if len(full_text) >= _BUDGET_MIN_LENGTH else None
+    
+    return ExtractedInfo(
+        website_type=_first_match(_WEBSITE_RULES, full_text, lowered),
+        expected_traffic=_first_match(_TRAFFIC_RULES, full_text, lowered),
+        database_needs=database_needs,
+        storage_requirements=storage_requirements,
+        budget_constraints=int(budget_match.group(1)) if budget_match else None,
+        availability_requirements=_match(_AVAILABILITY_RULE, full_text, lowered),
+        scaling_needs=_match(_SCALING_RULE, full_text, lowered),
+        region_preferences=_first_match(_REGION_RULES, full_text, lowered),
+    )
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested dicts and lists into a hashable, order-independent form"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _RequirementsKey:
+    """Hashable wrapper around a requirements dictionary, used as a cache key"""
+
+    __slots__ = ("requirements", "_frozen", "_hash")
+
+    def __init__(self, requirements: Dict[str, Any]):
+        self.requirements = requirements
+        self._frozen = _freeze(requirements)
+        self._hash = hash(self._frozen)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _RequirementsKey) and self._frozen == other._frozen
+
 
 class ResourceAnalyzer:
     """
@@ -20,13 +202,19 @@ class ResourceAnalyzer:
     def __init__(self):
         """Initialize the resource analyzer"""
         self.logger = logger
+        self._cached_requirements = lru_cache(maxsize=REQUIREMENTS_CACHE_SIZE)(
+            self._build_requirements
+        )
+        self._cached_recommendations = lru_cache(maxsize=RECOMMENDATIONS_CACHE_SIZE)(
+            self._build_recommendations
+        )
 
-    def analyze_requirements(self, conversation_context: List[ConversationMessage]) -> List[OCIResource]:
+    def analyze_requirements(self, conversation_context: ConversationContext) -> List[OCIResource]:
         """
         Analyze conversation context to extract resource requirements
         
         Args:
-            conversation_context: List of conversation messages
+            conversation_context: List of conversation messages or (role, content, timestamp) tuples
             
         Returns:
             List of recommended OCI resources
@@ -42,131 +230,57 @@ class ResourceAnalyzer:
         # Generate resource recommendations
         recommendations = self._generate_recommendations(requirements)
         
-        self.logger.info(f"Generated {len(recommendations)} resource recommendations")
+        self.logger.info("Generated %d resource recommendations", len(recommendations))
         return recommendations
 
-    def _extract_information(self, conversation_context: List[ConversationMessage]) -> Dict[str, Any]:
+    def _extract_information(self, conversation_context: ConversationContext) -> ExtractedInfo:
         """
         Extract key information from conversation context
         
         Args:
-            conversation_context: List of conversation messages
+            conversation_context: List of conversation messages or (role, content, timestamp) tuples
             
         Returns:
-            Dictionary containing extracted information
+            Extracted information
         """
-        # Initialize extracted information
-        extracted_info = {
-            "website_type": None,
-            "expected_traffic": None,
-            "database_needs": None,
-            "storage_requirements": None,
-            "performance_requirements": None,
-            "budget_constraints": None,
-            "security_requirements": None,
-            "availability_requirements": None,
-            "scaling_needs": None,
-            "region_preferences": None,
-        }
-        
         # Combine all messages into a single text for analysis
-        full_text = " ".join([msg.content for msg in conversation_context])
-        
-        # Extract website type
-        website_patterns = [
-            (r"(static|simple)\s+(website|site|web\s+page)", "static"),
-            (r"(dynamic|interactive)\s+(website|site|web\s+application)", "dynamic"),
-            (r"(e-commerce|ecommerce|online\s+store|shop)", "ecommerce"),
-            (r"(blog|content\s+management|cms)", "blog"),
-            (r"(api|backend|service)", "api"),
-        ]
-        
-        for pattern, website_type in website_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                extracted_info["website_type"] = website_type
-                break
-        
-        # Extract expected traffic
-        traffic_patterns = [
-            (r"(low|small|minimal)\s+(traffic|visitors|users)", "low"),
-            (r"(medium|moderate)\s+(traffic|visitors|users)", "medium"),
-            (r"(high|large|heavy|substantial)\s+(traffic|visitors|users)", "high"),
-        ]
-        
-        for pattern, traffic_level in traffic_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                extracted_info["expected_traffic"] = traffic_level
-                break
-        
-        # Extract database needs
-        if re.search(r"(database|db|data\s+storage)", full_text, re.IGNORECASE):
-            if re.search(r"(sql|relational|mysql|postgresql)", full_text, re.IGNORECASE):
-                extracted_info["database_needs"] = "relational"
-            elif re.search(r"(nosql|mongodb|document|key-value)", full_text, re.IGNORECASE):
-                extracted_info["database_needs"] = "nosql"
-            else:
-                extracted_info["database_needs"] = "general"
-        
-        # Extract storage requirements
-        storage_match = re.search(r"(\d+)\s*(gb|tb|gigabytes|terabytes)", full_text, re.IGNORECASE)
-        if storage_match:
-            amount = int(storage_match.group(1))
-            unit = storage_match.group(2).lower()
-            
-            if unit in ["tb", "terabytes"]:
-                amount *= 1024  # Convert to GB
-            
-            extracted_info["storage_requirements"] = amount
-        
-        # Extract budget constraints
-        budget_match = re.search(r"budget\s+of\s+\$?(\d+)", full_text, re.IGNORECASE)
-        if budget_match:
-            extracted_info["budget_constraints"] = int(budget_match.group(1))
-        
-        # Extract availability requirements
-        if re.search(r"(high\s+availability|ha|always\s+available|99\.9)", full_text, re.IGNORECASE):
-            extracted_info["availability_requirements"] = "high"
-        
-        # Extract scaling needs
-        if re.search(r"(scal(e|ing|able)|grow|expand)", full_text, re.IGNORECASE):
-            extracted_info["scaling_needs"] = "required"
-        
-        # Extract region preferences
-        region_patterns = [
-            (r"(us|united\s+states|america)", "us"),
-            (r"(europe|eu|european)", "eu"),
-            (r"(asia|apac|asia\s+pacific)", "asia"),
-        ]
+        full_text = " ".join(
+            [msg[1] if isinstance(msg, tuple) else msg.content for msg in conversation_context]
+        )
         
-        for pattern, region in region_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                extracted_info["region_preferences"] = region
-                break
+        extracted_info = _extract_from_text(full_text)
         
-        self.logger.debug(f"Extracted information: {extracted_info}")
+        self.logger.debug("Extracted information: %s", extracted_info)
         return extracted_info
 
-    def _determine_requirements(self, extracted_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _determine_requirements(self, extracted_info: ExtractedInfo) -> Dict[str, Any]:
         """
         Determine resource requirements based on extracted information
         
+        Results are memoized per extracted information, so callers must not mutate them.
+        
         Args:
-            extracted_info: Dictionary containing extracted information
+            extracted_info: Extracted information
             
         Returns:
             Dictionary containing resource requirements
         """
+        return self._cached_requirements(extracted_info)
+
+    def _build_requirements(self, extracted_info: ExtractedInfo) -> Dict[str, Any]:
+        """Build resource requirements for extracted information"""
+        compute_req = self._determine_compute_requirements(extracted_info)
         requirements = {
-            "compute": self._determine_compute_requirements(extracted_info),
-            "network": self._determine_network_requirements(extracted_info),
+            "compute": compute_req,
+            "network": self._determine_network_requirements(extracted_info, compute_req),
             "database": self._determine_database_requirements(extracted_info),
             "storage": self._determine_storage_requirements(extracted_info),
         }
         
-        self.logger.debug(f"Determined requirements: {requirements}")
+        self.logger.debug("Determined requirements: %s", requirements)
         return requirements
 
-    def _determine_compute_requirements(self, extracted_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _determine_compute_requirements(self, extracted_info: ExtractedInfo) -> Dict[str, Any]:
         """Determine compute requirements based on extracted information"""
         compute_req = {
             "instance_count": 1,
@@ -176,31 +290,33 @@ class ResourceAnalyzer:
         }
         
         # Adjust based on website type
-        if extracted_info["website_type"] == "static":
+        if extracted_info.website_type == "static":
             compute_req["shape"] = "VM.Standard.E2.1.Micro"
             compute_req["ocpus"] = 1
             compute_req["memory_in_gbs"] = 1
-        elif extracted_info["website_type"] == "ecommerce":
+        elif extracted_info.website_type == "ecommerce":
             compute_req["shape"] = "VM.Standard.E4.Flex"
             compute_req["ocpus"] = 2
             compute_req["memory_in_gbs"] = 16
         
         # Adjust based on expected traffic
-        if extracted_info["expected_traffic"] == "high":
+        if extracted_info.expected_traffic == "high":
             compute_req["instance_count"] = 2
             compute_req["ocpus"] = max(compute_req["ocpus"], 4)
             compute_req["memory_in_gbs"] = max(compute_req["memory_in_gbs"], 32)
         
         # Adjust for scaling needs
-        if extracted_info["scaling_needs"] == "required":
+        if extracted_info.scaling_needs == "required":
             compute_req["autoscaling"] = True
             compute_req["min_instances"] = compute_req["instance_count"]
             compute_req["max_instances"] = compute_req["instance_count"] * 3
         
         return compute_req
 
-    def _determine_network_requirements(self, extracted_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Determine network requirements based on extracted information"""
+    def _determine_network_requirements(
+        self, extracted_info: ExtractedInfo, compute_req: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Determine network requirements based on extracted information and compute sizing"""
         network_req = {
             "vcn_cidr": "10.0.0.0/16",
             "subnet_cidr": "10.0.0.0/24",
@@ -208,29 +324,20 @@ class ResourceAnalyzer:
         }
         
         # Add load balancer for high traffic or multiple instances
-        compute_req = self._determine_compute_requirements(extracted_info)
-        if extracted_info["expected_traffic"] == "high" or compute_req["instance_count"] > 1:
+        if extracted_info.expected_traffic == "high" or compute_req["instance_count"] > 1:
             network_req["load_balancer"] = True
             network_req["load_balancer_shape"] = "flexible"
             network_req["load_balancer_min_shape"] = 10
             network_req["load_balancer_max_shape"] = 100
         
-        # Add security list rules based on website type
-        network_req["security_list_rules"] = [
-            {"protocol": "6", "port": 80, "source": "0.0.0.0/0"},  # HTTP
-            {"protocol": "6", "port": 443, "source": "0.0.0.0/0"},  # HTTPS
-        ]
-        
-        # Add SSH access
-        network_req["security_list_rules"].append(
-            {"protocol": "6", "port": 22, "source": "0.0.0.0/0"}  # SSH
-        )
+        # Add security list rules, copied so the shared defaults cannot be mutated
+        network_req["security_list_rules"] = [dict(rule) for rule in _DEFAULT_SEC_RULES]
         
         return network_req
 
-    def _determine_database_requirements(self, extracted_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _determine_database_requirements(self, extracted_info: ExtractedInfo) -> Optional[Dict[str, Any]]:
         """Determine database requirements based on extracted information"""
-        if not extracted_info["database_needs"]:
+        if not extracted_info.database_needs:
             return None
         
         database_req = {
@@ -241,39 +348,39 @@ class ResourceAnalyzer:
         }
         
         # Adjust based on database type
-        if extracted_info["database_needs"] == "relational":
+        if extracted_info.database_needs == "relational":
             database_req["type"] = "autonomous"
             database_req["db_name"] = "OCIDB"
-        elif extracted_info["database_needs"] == "nosql":
+        elif extracted_info.database_needs == "nosql":
             database_req["type"] = "nosql"
             database_req["table_name"] = "OCITable"
         
         # Adjust based on expected traffic
-        if extracted_info["expected_traffic"] == "high":
+        if extracted_info.expected_traffic == "high":
             database_req["cpu_core_count"] = 2
             database_req["storage_in_tbs"] = 2
         
         return database_req
 
-    def _determine_storage_requirements(self, extracted_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _determine_storage_requirements(self, extracted_info: ExtractedInfo) -> Dict[str, Any]:
         """Determine storage requirements based on extracted information"""
         storage_req = {
-            "block_volume_size_in_gbs": 50,
+            "block_volume_size_in_gbs": _MIN_BLOCK_VOLUME_GBS,
             "object_storage": True,
         }
         
         # Adjust based on storage requirements
-        if extracted_info["storage_requirements"]:
+        if extracted_info.storage_requirements:
             storage_req["block_volume_size_in_gbs"] = max(
-                50, extracted_info["storage_requirements"]
+                _MIN_BLOCK_VOLUME_GBS, extracted_info.storage_requirements
             )
         
         # Adjust based on website type
-        if extracted_info["website_type"] == "static":
-            storage_req["block_volume_size_in_gbs"] = 50
-        elif extracted_info["website_type"] in ["ecommerce", "dynamic"]:
+        if extracted_info.website_type == "static":
+            storage_req["block_volume_size_in_gbs"] = _MIN_BLOCK_VOLUME_GBS
+        elif extracted_info.website_type in ["ecommerce", "dynamic"]:
             storage_req["block_volume_size_in_gbs"] = max(
-                storage_req["block_volume_size_in_gbs"], 100
+                storage_req["block_volume_size_in_gbs"], _DYNAMIC_BLOCK_VOLUME_GBS
             )
         
         return storage_req
@@ -282,12 +389,34 @@ class ResourceAnalyzer:
         """
         Generate resource recommendations based on requirements
         
+        The memoized recommendations are deep-copied, so callers may modify the
+        returned resources without affecting later analyses.
+        
         Args:
             requirements: Dictionary containing resource requirements
             
         Returns:
             List of recommended OCI resources
         """
+        return [
+            resource.model_copy(deep=True)
+            for resource in self._cached_recommendations(_RequirementsKey(requirements))
+        ]
+
+    def _build_recommendations(self, key: "_RequirementsKey") -> Tuple[OCIResource, ...]:
+        """
+        Build resource recommendations for a set of requirements
+        
+        Results are memoized per requirements, so the returned resources are shared
+        and must be copied before being handed out.
+        
+        Args:
+            key: Hashable wrapper around the resource requirements
+            
+        Returns:
+            Tuple of recommended OCI resources
+        """
+        requirements = key.requirements
         recommendations = []
         
         # Compute instance recommendation
@@ -304,7 +433,7 @@ class ResourceAnalyzer:
                 "image_id": "Oracle-Linux-8.6-2022.05.31-0",
             },
             estimated_cost={
-                "monthly": 50.0 * compute_req["ocpus"] * compute_req["instance_count"],
+                "monthly": _Costs.OCPU_MONTHLY * compute_req["ocpus"] * compute_req["instance_count"],
                 "currency": "USD",
             },
         )
@@ -340,7 +469,10 @@ class ResourceAnalyzer:
                     "max_bandwidth_mbps": network_req["load_balancer_max_shape"],
                 },
                 estimated_cost={
-                    "monthly": 10.0 + (0.0017 * 730 * network_req["load_balancer_min_shape"]),
+                    "monthly": (
+                        _Costs.LB_BASE_MONTHLY
+                        + _Costs.LB_MBPS_MONTHLY * network_req["load_balancer_min_shape"]
+                    ),
                     "currency": "USD",
                 },
                 dependencies=["WebsiteVCN"],
@@ -361,7 +493,7 @@ class ResourceAnalyzer:
                     "cpu_core_count": db_req["cpu_core_count"],
                 },
                 estimated_cost={
-                    "monthly": 900.0 * db_req["cpu_core_count"],
+                    "monthly": _Costs.DB_CORE_MONTHLY * db_req["cpu_core_count"],
                     "currency": "USD",
                 },
                 dependencies=["WebsiteVCN"],
@@ -379,7 +511,7 @@ class ResourceAnalyzer:
                 "vpus_per_gb": 10,
             },
             estimated_cost={
-                "monthly": 0.0255 * storage_req["block_volume_size_in_gbs"],
+                "monthly": _Costs.BLOCK_GB_MONTHLY * storage_req["block_volume_size_in_gbs"],
                 "currency": "USD",
             },
             dependencies=["WebServer"],
@@ -397,10 +529,10 @@ class ResourceAnalyzer:
                     "auto_tiering": True,
                 },
                 estimated_cost={
-                    "monthly": 0.0255 * 100,  # Assuming 100GB of object storage
+                    "monthly": _Costs.OBJECT_STORAGE_MONTHLY,
                     "currency": "USD",
                 },
             )
             recommendations.append(bucket_resource)
         
-        return recommendations
+        return tuple(recommendations)
@@ -3,31 +3,69 @@ Resource Provisioner for the OCI MCP Server
 """
 import json
 import logging
+import random
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
-from api.schemas import OCIResource, ProvisionedResource, ResourceStatus
+from api.schemas import OCIResource, ProvisionedResource, ResourceStatus, ResourceType
 from services.oci_client import OCIClient
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of resources provisioned concurrently within a dependency level
+MAX_PROVISIONING_WORKERS = 8
+
+# Buffered status updates are flushed after this many resources or this much time
+PROGRESS_FLUSH_SIZE = 8
+PROGRESS_FLUSH_INTERVAL_SECONDS = 0.05
+
+# Maximum number of provisioning requests kept in memory; least recently used are evicted
+MAX_PROVISIONING_REQUESTS = 1000
+
+# Non-cryptographic generator for mock IP address octets
+_rng = random.Random()
+
+# Mock OCID prefix per resource type, completed with a random hex suffix
+_OCID_PREFIXES = {
+    resource_type: f"ocid1.{resource_type.value}.oc1..aaaaaaaa" for resource_type in ResourceType
+}
+
 
 class ResourceProvisioner:
     """
     Provisions OCI resources based on confirmed recommendations
     """
 
-    def __init__(self):
-        """Initialize the resource provisioner"""
+    def __init__(self, oci_client: Optional[OCIClient] = None):
+        """
+        Initialize the resource provisioner
+        
+        Args:
+            oci_client: OCI client to use; a new one is created if not provided
+        """
         self.logger = logger
-        self.oci_client = OCIClient()
+        self.oci_client = oci_client or OCIClient()
         
         # In-memory storage for provisioning requests
         # In a production environment, this would be stored in a database
-        self.provisioning_requests = {}
+        self.provisioning_requests: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Provisioning handlers by resource type
+        self._dispatch = {
+            ResourceType.COMPUTE: self._provision_compute_instance,
+            ResourceType.NETWORK: self._provision_network,
+            ResourceType.DATABASE: self._provision_database,
+            ResourceType.STORAGE: self._provision_storage,
+            ResourceType.LOAD_BALANCER: self._provision_load_balancer,
+        }
 
     def provision_resources(
         self, request_id: str, resources: List[OCIResource]
@@ -42,66 +80,80 @@ class ResourceProvisioner:
         Returns:
             List of provisioned resources
         """
-        self.logger.info(f"Starting resource provisioning for request {request_id}")
-        
-        # Initialize provisioning request
-        if request_id not in self.provisioning_requests:
-            self.provisioning_requests[request_id] = {
-                "status": "in_progress",
-                "started_at": datetime.now().isoformat(),
-                "estimated_completion": (datetime.now() + timedelta(minutes=15)).isoformat(),
-                "resources": [],
-                "progress": 0.0,
-            }
+        self.logger.info("Starting resource provisioning for request %s", request_id)
         
-        # Sort resources by dependencies
-        sorted_resources = self._sort_resources_by_dependencies(resources)
+        # Timestamp shared by the request and every resource provisioned in this batch
+        started_at = datetime.now()
+        time_created = started_at.isoformat()
         
-        # Provision resources in order
+        # Initialize provisioning request, evicting the least recently used ones over the cap
+        with self._lock:
+            if request_id not in self.provisioning_requests:
+                self.provisioning_requests[request_id] = {
+                    "status": "in_progress",
+                    "started_at": time_created,
+                    "estimated_completion": (started_at + timedelta(minutes=15)).isoformat(),
+                    "resources": [],
+                    "progress": 0.0,
+                }
+            self.provisioning_requests.move_to_end(request_id)
+            while len(self.provisioning_requests) > MAX_PROVISIONING_REQUESTS:
+                self.provisioning_requests.popitem(last=False)
+            
+            # Keep a reference so updates still land if the request is evicted mid-run
+            provisioning_request = self.provisioning_requests[request_id]
+        
+        # Group resources into dependency levels
+        levels = self._level_resources_by_dependencies(resources)
+        
+        # Provision each level concurrently, one level at a time
         provisioned_resources = []
-        total_resources = len(sorted_resources)
+        total_resources = len(resources)
+        pending_updates = []
+        completed = 0
+        last_flush = time.monotonic()
         
-        for i, resource in enumerate(sorted_resources):
-            try:
-                self.logger.info(f"Provisioning {resource.resource_type} resource: {resource.name}")
-                
-                # Update progress
-                progress_percentage = (i / total_resources) * 100
-                self.provisioning_requests[request_id]["progress"] = progress_percentage
-                
-                # Provision resource based on type
-                provisioned = self._provision_resource(resource)
-                provisioned_resources.append(provisioned)
-                
-                # Update provisioning request
-                self.provisioning_requests[request_id]["resources"].append({
-                    "name": provisioned.name,
-                    "type": provisioned.resource_type,
-                    "status": provisioned.status,
-                    "ocid": provisioned.ocid,
-                })
-                
-                self.logger.info(f"Successfully provisioned {resource.name}")
-                
-            except Exception as e:
-                self.logger.error(f"Error provisioning {resource.name}: {str(e)}")
-                
-                # Update provisioning request with error
-                self.provisioning_requests[request_id]["resources"].append({
-                    "name": resource.name,
-                    "type": resource.resource_type,
-                    "status": "failed",
-                    "error": str(e),
-                })
+        provision = partial(self._try_provision_resource, time_created=time_created)
+        
+        with ThreadPoolExecutor(max_workers=MAX_PROVISIONING_WORKERS) as executor:
+            for level in levels:
+                outcomes = list(executor.map(provision, level))
                 
-                # Continue with next resource
-                continue
+                for resource, (provisioned, error) in zip(level, outcomes):
+                    if provisioned is not None:
+                        provisioned_resources.append(provisioned)
+                        pending_updates.append({
+                            "name": provisioned.name,
+                            "type": provisioned.resource_type,
+                            "status": provisioned.status,
+                            "ocid": provisioned.ocid,
+                        })
+                    else:
+                        # Record the error and continue with the remaining resources
+                        pending_updates.append({
+                            "name": resource.name,
+                            "type": resource.resource_type,
+                            "status": "failed",
+                            "error": error,
+                        })
+                    
+                    # Flush buffered updates once enough have accumulated or enough time has passed
+                    if (
+                        len(pending_updates) >= PROGRESS_FLUSH_SIZE
+                        or time.monotonic() - last_flush >= PROGRESS_FLUSH_INTERVAL_SECONDS
+                    ):
+                        completed += len(pending_updates)
+                        self._flush_progress(provisioning_request, pending_updates, completed, total_resources)
+                        pending_updates = []
+                        last_flush = time.monotonic()
         
         # Update final status
-        self.provisioning_requests[request_id]["status"] = "completed"
-        self.provisioning_requests[request_id]["progress"] = 100.0
+        with self._lock:
+            provisioning_request["resources"].extend(pending_updates)
+            provisioning_request["status"] = "completed"
+            provisioning_request["progress"] = 100.0
         
-        self.logger.info(f"Completed resource provisioning for request {request_id}")
+        self.logger.info("Completed resource provisioning for request %s", request_id)
         return provisioned_resources
 
     def get_provisioning_status(self, request_id: str) -> Dict[str, Any]:
@@ -114,19 +166,43 @@ class ResourceProvisioner:
         Returns:
             Dictionary containing provisioning status
         """
-        if request_id not in self.provisioning_requests:
+        with self._lock:
+            if request_id not in self.provisioning_requests:
+                return {
+                    "request_id": request_id,
+                    "status": "not_found",
+                    "message": f"No provisioning request found with ID {request_id}",
+                    "progress": 0.0,
+                    "resources": [],
+                }
+            
+            self.provisioning_requests.move_to_end(request_id)
+            provisioning_request = self.provisioning_requests[request_id]
             return {
                 "request_id": request_id,
-                "status": "not_found",
-                "message": f"No provisioning request found with ID {request_id}",
-                "progress": 0.0,
-                "resources": [],
+                **provisioning_request,
+                "resources": list(provisioning_request["resources"]),
             }
+
+    def _flush_progress(
+        self,
+        provisioning_request: Dict[str, Any],
+        updates: List[Dict[str, Any]],
+        completed: int,
+        total: int,
+    ) -> None:
+        """
+        Merge buffered resource updates into a provisioning request
         
-        return {
-            "request_id": request_id,
-            **self.provisioning_requests[request_id],
-        }
+        Args:
+            provisioning_request: State of the provisioning request to update
+            updates: Resource status entries to record
+            completed: Number of resources recorded once the updates are merged
+            total: Total number of resources in the request
+        """
+        with self._lock:
+            provisioning_request["resources"].extend(updates)
+            provisioning_request["progress"] = (completed / total) * 100
 
     def _sort_resources_by_dependencies(self, resources: List[OCIResource]) -> List[OCIResource]:
         """
@@ -138,49 +214,79 @@ class ResourceProvisioner:
         Returns:
             Sorted list of resources
         """
+        return [resource for level in self._level_resources_by_dependencies(resources) for resource in level]
+
+    def _level_resources_by_dependencies(self, resources: List[OCIResource]) -> List[List[OCIResource]]:
+        """
+        Group resources into levels whose dependencies are all in earlier levels
+        
+        Args:
+            resources: List of resources to group
+            
+        Returns:
+            List of levels, each a list of resources that can be provisioned together
+        """
         # Create a mapping of resource names to resources
         resource_map = {resource.name: resource for resource in resources}
         
-        # Create a dependency graph
-        dependency_graph = {resource.name: set() for resource in resources}
-        for resource in resources:
-            if resource.dependencies:
-                for dependency in resource.dependencies:
-                    if dependency in resource_map:
-                        dependency_graph[resource.name].add(dependency)
-        
-        # Perform topological sort
-        visited = set()
-        temp_visited = set()
-        order = []
-        
-        def visit(name):
-            if name in temp_visited:
-                raise ValueError(f"Circular dependency detected for {name}")
-            if name in visited:
-                return
-            
-            temp_visited.add(name)
-            for dependency in dependency_graph[name]:
-                visit(dependency)
-            
-            temp_visited.remove(name)
-            visited.add(name)
-            order.append(name)
+        # Count unmet dependencies per resource and record each dependency's dependents
+        in_degree = {name: 0 for name in resource_map}
+        dependents = {name: [] for name in resource_map}
+        for resource in resource_map.values():
+            for dependency in set(resource.dependencies):
+                if dependency in resource_map:
+                    in_degree[resource.name] += 1
+                    dependents[dependency].append(resource.name)
+        
+        # Perform topological sort (Kahn's algorithm), one level at a time
+        levels = []
+        level = [name for name, degree in in_degree.items() if degree == 0]
+        while level:
+            levels.append(level)
+            next_level = []
+            for name in level:
+                for dependent in dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_level.append(dependent)
+            level = next_level
         
-        for name in dependency_graph:
-            if name not in visited:
-                visit(name)
+        if sum(len(level) for level in levels) != len(resource_map):
+            cyclic = [name for name, degree in in_degree.items() if degree > 0]
+            raise ValueError(f"Circular dependency detected for {', '.join(cyclic)}")
         
         # Convert back to resource objects in the correct order
-        return [resource_map[name] for name in reversed(order)]
+        return [[resource_map[name] for name in level] for level in levels]
 
-    def _provision_resource(self, resource: OCIResource) -> ProvisionedResource:
+    def _try_provision_resource(
+        self, resource: OCIResource, time_created: str
+    ) -> Tuple[Optional[ProvisionedResource], Optional[str]]:
+        """
+        Provision a single OCI resource, capturing any error
+        
+        Args:
+            resource: Resource to provision
+            time_created: ISO timestamp to record as the resource creation time
+            
+        Returns:
+            Tuple of the provisioned resource (or None) and the error message (or None)
+        """
+        try:
+            self.logger.info("Provisioning %s resource: %s", resource.resource_type, resource.name)
+            provisioned = self._provision_resource(resource, time_created)
+            self.logger.info("Successfully provisioned %s", resource.name)
+            return provisioned, None
+        except Exception as e:
+            self.logger.error("Error provisioning %s: %s", resource.name, e)
+            return None, str(e)
+
+    def _provision_resource(self, resource: OCIResource, time_created: str) -> ProvisionedResource:
         """
         Provision a single OCI resource
         
         Args:
             resource: Resource to provision
+            time_created: ISO timestamp to record as the resource creation time
             
         Returns:
             Provisioned resource
@@ -188,27 +294,22 @@ class ResourceProvisioner:
         # In a real implementation, this would call the OCI SDK to provision resources
         # For demonstration purposes, we'll simulate the provisioning process
         
+        # Look up the provisioning handler for the resource type
+        handler = self._dispatch.get(resource.resource_type)
+        if handler is None:
+            raise ValueError(f"Unsupported resource type: {resource.resource_type}")
+        
         # Simulate provisioning delay
         time.sleep(1)
         
         # Generate a mock OCID
-        ocid = f"ocid1.{resource.resource_type.lower()}.oc1..aaaaaaaa{uuid.uuid4().hex}"
-        
-        # Provision based on resource type
-        if resource.resource_type == "compute":
-            return self._provision_compute_instance(resource, ocid)
-        elif resource.resource_type == "network":
-            return self._provision_network(resource, ocid)
-        elif resource.resource_type == "database":
-            return self._provision_database(resource, ocid)
-        elif resource.resource_type == "storage":
-            return self._provision_storage(resource, ocid)
-        elif resource.resource_type == "load_balancer":
-            return self._provision_load_balancer(resource, ocid)
-        else:
-            raise ValueError(f"Unsupported resource type: {resource.resource_type}")
+        ocid = _OCID_PREFIXES[resource.resource_type] + uuid.uuid4().hex
+        
+        return handler(resource, ocid, time_created)
 
-    def _provision_compute_instance(self, resource: OCIResource, ocid: str) -> ProvisionedResource:
+    def _provision_compute_instance(
+        self, resource: OCIResource, ocid: str, time_created: str
+    ) -> ProvisionedResource:
         """Provision a compute instance"""
         # In a real implementation, this would call the OCI Compute API
         
@@ -229,16 +330,18 @@ class ResourceProvisioner:
                 "memory_in_gbs": memory_in_gbs,
                 "availability_domain": "AD-1",
                 "fault_domain": "FAULT-DOMAIN-1",
-                "time_created": datetime.now().isoformat(),
+                "time_created": time_created,
             },
             access_info={
-                "public_ip": f"10.0.0.{uuid.uuid4().int % 255}",
-                "private_ip": f"192.168.0.{uuid.uuid4().int % 255}",
+                "public_ip": f"10.0.0.{_rng.randrange(255)}",
+                "private_ip": f"192.168.0.{_rng.randrange(255)}",
                 "hostname": f"{resource.name.lower()}.example.com",
             },
         )
 
-    def _provision_network(self, resource: OCIResource, ocid: str) -> ProvisionedResource:
+    def _provision_network(
+        self, resource: OCIResource, ocid: str, time_created: str
+    ) -> ProvisionedResource:
         """Provision a network resource"""
         # In a real implementation, this would call the OCI Networking API
         
@@ -256,14 +359,16 @@ class ResourceProvisioner:
                 "vcn_cidr": vcn_cidr,
                 "subnet_cidr": subnet_cidr,
                 "dns_label": resource.name.lower().replace("-", ""),
-                "time_created": datetime.now().isoformat(),
+                "time_created": time_created,
             },
             access_info={
                 "vcn_domain_name": f"{resource.name.lower().replace('-', '')}.oraclevcn.com",
             },
         )
 
-    def _provision_database(self, resource: OCIResource, ocid: str) -> ProvisionedResource:
+    def _provision_database(
+        self, resource: OCIResource, ocid: str, time_created: str
+    ) -> ProvisionedResource:
         """Provision a database resource"""
         # In a real implementation, this would call the OCI Database API
         
@@ -282,7 +387,7 @@ class ResourceProvisioner:
                 "db_type": db_type,
                 "workload_type": workload_type,
                 "storage_in_tbs": storage_in_tbs,
-                "time_created": datetime.now().isoformat(),
+                "time_created": time_created,
             },
             access_info={
                 "connection_string": f"{resource.name.lower()}.adb.{self.oci_client.region}.oraclecloudapps.com",
@@ -290,7 +395,9 @@ class ResourceProvisioner:
             },
         )
 
-    def _provision_storage(self, resource: OCIResource, ocid: str) -> ProvisionedResource:
+    def _provision_storage(
+        self, resource: OCIResource, ocid: str, time_created: str
+    ) -> ProvisionedResource:
         """Provision a storage resource"""
         # In a real implementation, this would call the OCI Storage API
         
@@ -306,7 +413,7 @@ class ResourceProvisioner:
             details={
                 "size_in_gbs": size_in_gbs,
                 "vpus_per_gb": resource.specifications.get("vpus_per_gb", 10),
-                "time_created": datetime.now().isoformat(),
+                "time_created": time_created,
             },
             access_info={
                 "iqn": f"iqn.2015-12.com.oracleiaas:{uuid.uuid4().hex}",
@@ -314,7 +421,9 @@ class ResourceProvisioner:
             },
         )
 
-    def _provision_load_balancer(self, resource: OCIResource, ocid: str) -> ProvisionedResource:
+    def _provision_load_balancer(
+        self, resource: OCIResource, ocid: str, time_created: str
+    ) -> ProvisionedResource:
         """Provision a load balancer resource"""
         # In a real implementation, this would call the OCI Load Balancer API
         
@@ -333,10 +442,10 @@ class ResourceProvisioner:
                 "shape": shape,
                 "min_bandwidth_mbps": min_bandwidth_mbps,
                 "max_bandwidth_mbps": max_bandwidth_mbps,
-                "time_created": datetime.now().isoformat(),
+                "time_created": time_created,
             },
             access_info={
-                "ip_address": f"10.0.0.{uuid.uuid4().int % 255}",
+                "ip_address": f"10.0.0.{_rng.randrange(255)}",
                 "hostname": f"{resource.name.lower()}.example.com",
             },
         )
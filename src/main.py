@@ -4,29 +4,49 @@ OCI MCP Server - Main Application Entry Point
 """
 import logging
 import os
+import sys
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-import uvicorn
 import yaml
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-from api.router import router as api_router
+from api.orjson_response import ORJSONResponse
+from api.router import get_oci_client, router as api_router
 from utils.config import load_config
 from utils.logger import setup_logger
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create and warm up the shared OCI client at startup so the first request does not pay for it"""
+    try:
+        oci_client = get_oci_client()
+    except HTTPException as e:
+        # The client is created on first use instead
+        logger.error("Startup: %s", e.detail)
+    else:
+        # Warm up in the background so an unreachable OCI endpoint cannot delay startup
+        threading.Thread(target=oci_client.warm_up, name="oci-warm-up", daemon=True).start()
+    yield
+
+
 # Initialize the FastAPI application
 app = FastAPI(
     title="OCI MCP Server",
     description="Model Context Protocol Server for Oracle Cloud Infrastructure Resource Provisioning",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Load configuration
 config_path = os.environ.get("CONFIG_PATH", "config.yaml")
 if not os.path.exists(config_path):
     config_path = "config.example.yaml"
-    logging.warning(f"Config file not found, using example config: {config_path}")
+    logging.warning("Config file not found, using example config: %s", config_path)
 
 config = load_config(config_path)
 
@@ -34,6 +54,8 @@ config = load_config(config_path)
 log_config = config.get("logging", {})
 log_file = log_config.get("file_path", "logs/mcp_server.log")
 log_level = config.get("server", {}).get("log_level", "info").upper()
+# Create the log directory once, before the file handler opens the log file
+Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 setup_logger(log_file, log_level)
 
 logger = logging.getLogger(__name__)
@@ -48,9 +70,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Token required by the admin endpoints, which stay disabled without one
+app.state.admin_token = config.get("security", {}).get("admin_token")
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -59,16 +85,22 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import uvicorn
+    
     server_config = config.get("server", {})
     host = server_config.get("host", "0.0.0.0")
     port = server_config.get("port", 8000)
     debug = server_config.get("debug", False)
     
-    logger.info(f"Starting OCI MCP Server on {host}:{port}")
-    
-    # Ensure log directory exists
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    logger.info("Starting OCI MCP Server on %s:%s", host, port)
     
-    uvicorn.run("main:app", host=host, port=port, reload=debug)
+    uvicorn.run(
+        "main:app",
+        host=host,
+        port=port,
+        reload=debug,
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=server_config.get("workers", 1),
+    )
@@ -1,30 +1,158 @@
 """
 OCI Client Service for the MCP Server
 """
+import asyncio
 import logging
+import operator
 import os
-from typing import Any, Dict, List, Optional
-
-import oci
-from oci.config import from_file
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from utils.config import get_oci_config
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of blocking OCI SDK calls running at once
+MAX_CONCURRENT_OCI_CALLS = 10
+
+# Maximum number of lifecycle state waits running at once
+MAX_CONCURRENT_OCI_WAITS = 10
+
+# Dedicated worker threads for blocking OCI SDK calls, shared by all clients so they
+# never compete with the event loop's default executor
+_OCI_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_OCI_CALLS, thread_name_prefix="oci")
+
+# Lifecycle waits poll for minutes, so they get their own threads and cannot hold up
+# short calls queued on _OCI_EXECUTOR
+_OCI_WAIT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_OCI_WAITS, thread_name_prefix="oci-wait"
+)
+
+# Compute shapes fetched from OCI are reused for this many seconds
+COMPUTE_SHAPES_CACHE_TTL_SECONDS = 3600
+
+# Returned by get_compute_shapes for demonstration purposes when OCI cannot be reached
+DEFAULT_COMPUTE_SHAPES = [
+    {
+        "shape": "VM.Standard.E4.Flex",
+        "ocpus": "1-64",
+        "memory_in_gbs": "16-1024",
+        "processor_description": "2.55 GHz AMD EPYC™ 7J13",
+    },
+    {
+        "shape": "VM.Standard.E3.Flex",
+        "ocpus": "1-64",
+        "memory_in_gbs": "16-1024",
+        "processor_description": "2.25 GHz AMD EPYC™ 7742",
+    },
+    {
+        "shape": "VM.Standard.A1.Flex",
+        "ocpus": "1-80",
+        "memory_in_gbs": "6-512",
+        "processor_description": "Ampere® Altra® Q80-30",
+    },
+    {
+        "shape": "VM.Standard2.1",
+        "ocpus": 1,
+        "memory_in_gbs": 15,
+        "processor_description": "2.0 GHz Intel® Xeon® Platinum 8167M",
+    },
+]
+
+_AVAILABLE_RESOURCE_TYPES = (
+    "Compute Instance",
+    "Virtual Cloud Network",
+    "Subnet",
+    "Internet Gateway",
+    "Route Table",
+    "Security List",
+    "Network Security Group",
+    "Load Balancer",
+    "Autonomous Database",
+    "Block Volume",
+    "Object Storage Bucket",
+    "File Storage",
+    "Kubernetes Cluster",
+)
+
+# OCI DNS labels are limited to 15 characters
+DNS_LABEL_MAX_LENGTH = 15
+
+# Lowercases ASCII letters and drops hyphens in a single translate pass
+_DNS_LABEL_TABLE = str.maketrans(
+    {**{c: c.lower() for c in string.ascii_uppercase}, "-": None}
+)
+
+# Compute shape attributes returned by get_compute_shapes, in output order
+_SHAPE_FIELDS = (
+    "shape",
+    "ocpus",
+    "memory_in_gbs",
+    "networking_bandwidth_in_gbps",
+    "max_vnic_attachments",
+    "gpus",
+    "local_disks",
+    "local_disks_total_size_in_gbs",
+    "processor_description",
+)
+_get_shape_fields = operator.attrgetter(*_SHAPE_FIELDS)
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=8)
+def _cached_from_file(path: str, profile_name: str, signature: Tuple[int, int, int]) -> Dict[str, Any]:
+    """
+    Parse an OCI config file profile, reusing the result while the file is unchanged
+    
+    Args:
+        path: Path to the OCI config file
+        profile_name: Profile to load from the file
+        signature: (mtime_ns, size, inode) of the file, so edits invalidate the cache
+        
+    Returns:
+        Dictionary containing the profile's OCI configuration
+    """
+    # Imported lazily: the oci package is slow to import
+    from oci.config import from_file
+    
+    return from_file(path, profile_name)
+
 
 class OCIClient:
     """
     Client for interacting with Oracle Cloud Infrastructure APIs
     """
 
+    __slots__ = (
+        "logger",
+        "config",
+        "region",
+        "_compute_shapes_cache",
+        "_namespace",
+        "compute_client",
+        "network_client",
+        "block_storage_client",
+        "database_client",
+        "load_balancer_client",
+        "object_storage_client",
+        "identity_client",
+    )
+
     def __init__(self):
         """Initialize the OCI client"""
         self.logger = logger
         self.config = self._load_config()
         self.region = self.config.get("region", "us-ashburn-1")
         
+        # Cached lookups: compute shapes per compartment with fetch time, and the namespace
+        self._compute_shapes_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._namespace: Optional[str] = None
+        
         # Initialize OCI clients
         self._init_clients()
 
@@ -46,10 +174,13 @@ class OCIClient:
             config_file_path = os.path.expanduser(config_file_path)
             
             try:
-                self.logger.info(f"Loading OCI config from {config_file_path}")
-                return from_file(config_file_path, profile_name)
+                self.logger.info("Loading OCI config from %s", config_file_path)
+                stat = os.stat(config_file_path)
+                signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                # Copy so callers never mutate the cached profile
+                return dict(_cached_from_file(config_file_path, profile_name, signature))
             except Exception as e:
-                self.logger.error(f"Error loading OCI config from file: {str(e)}")
+                self.logger.error("Error loading OCI config from file: %s", e)
         
         # Use direct configuration if config file is not available
         self.logger.info("Using direct OCI configuration")
@@ -63,6 +194,10 @@ class OCIClient:
 
     def _init_clients(self) -> None:
         """Initialize OCI service clients"""
+        import oci
+        # The SDK's vendored requests, so connection errors stay SDK exceptions and are retried
+        from oci._vendor.requests.adapters import HTTPAdapter
+        
         try:
             # Initialize compute client
             self.compute_client = oci.core.ComputeClient(self.config)
@@ -85,97 +220,154 @@ class OCIClient:
             # Initialize identity client for compartment operations
             self.identity_client = oci.identity.IdentityClient(self.config)
             
+            # Size each client's connection pool to the number of concurrent calls and waits allowed
+            pool_maxsize = MAX_CONCURRENT_OCI_CALLS + MAX_CONCURRENT_OCI_WAITS
+            for client in self._service_clients():
+                client.base_client.session.mount(
+                    "https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+                )
+            
             self.logger.info("OCI clients initialized successfully")
         except Exception as e:
-            self.logger.error(f"Error initializing OCI clients: {str(e)}")
+            self.logger.error("Error initializing OCI clients: %s", e)
             raise
 
-    def get_available_resource_types(self) -> List[str]:
+    def _service_clients(self) -> List[Any]:
+        """Get all OCI service clients"""
+        return [
+            self.compute_client,
+            self.network_client,
+            self.block_storage_client,
+            self.database_client,
+            self.load_balancer_client,
+            self.object_storage_client,
+            self.identity_client,
+        ]
+
+    def warm_up(self) -> None:
+        """
+        Open a connection on every service client with one cheap request each
+        
+        Requests run concurrently without retries. Failures are logged and ignored, since
+        warming up is only an optimization.
+        """
+        import oci
+        
+        tenancy_id = self.config.get("tenancy")
+        no_retry = oci.retry.NoneRetryStrategy()
+        calls = {
+            "compute": partial(self.compute_client.list_shapes, tenancy_id, limit=1),
+            "network": partial(self.network_client.list_vcns, tenancy_id, limit=1),
+            "block storage": partial(
+                self.block_storage_client.list_volumes, compartment_id=tenancy_id, limit=1
+            ),
+            "database": partial(self.database_client.list_autonomous_databases, tenancy_id, limit=1),
+            "load balancer": partial(self.load_balancer_client.list_shapes, tenancy_id, limit=1),
+            "object storage": self.object_storage_client.get_namespace,
+            "identity": self.identity_client.list_regions,
+        }
+        
+        def call(name: str) -> None:
+            try:
+                calls[name](retry_strategy=no_retry)
+            except Exception as e:
+                self.logger.warning("Error warming up OCI %s client: %s", name, e)
+        
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            list(executor.map(call, calls))
+        
+        self.logger.info("OCI clients warmed up")
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking OCI SDK call on the shared OCI executor
+        
+        Calls beyond MAX_CONCURRENT_OCI_CALLS wait in the executor's queue.
+        
+        Args:
+            func: SDK function to call
+            *args: Positional arguments for the call
+            **kwargs: Keyword arguments for the call
+            
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_OCI_EXECUTOR, partial(func, *args, **kwargs))
+
+    async def _wait_for_state(
+        self, client: Any, get_resource: Callable[[str], Any], resource_id: str, state: str
+    ) -> Any:
+        """
+        Poll a resource on the wait executor until it reaches a lifecycle state
+        
+        Waits beyond MAX_CONCURRENT_OCI_WAITS queue behind the running ones.
+        
+        Args:
+            client: OCI service client owning the resource
+            get_resource: Client method that fetches the resource by ID
+            resource_id: ID of the resource to poll
+            state: Lifecycle state to wait for
+            
+        Returns:
+            Response for the resource in the requested state
+        """
+        import oci
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _OCI_WAIT_EXECUTOR,
+            lambda: oci.wait_until(client, get_resource(resource_id), "lifecycle_state", state),
+        )
+
+    def get_available_resource_types(self) -> Tuple[str, ...]:
         """
         Get available OCI resource types that can be provisioned
         
         Returns:
-            List of resource type names
+            Tuple of resource type names, shared between calls
         """
         # In a real implementation, this might query OCI APIs for available resource types
-        # For demonstration purposes, we'll return a static list
-        return [
-            "Compute Instance",
-            "Virtual Cloud Network",
-            "Subnet",
-            "Internet Gateway",
-            "Route Table",
-            "Security List",
-            "Network Security Group",
-            "Load Balancer",
-            "Autonomous Database",
-            "Block Volume",
-            "Object Storage Bucket",
-            "File Storage",
-            "Kubernetes Cluster",
-        ]
+        # For demonstration purposes, we'll return a static tuple
+        return _AVAILABLE_RESOURCE_TYPES
 
     def get_compute_shapes(self) -> List[Dict[str, Any]]:
         """
         Get available compute shapes in the configured region
         
+        Shapes fetched from OCI are cached for COMPUTE_SHAPES_CACHE_TTL_SECONDS, so the
+        returned list is shared and must not be mutated. If OCI cannot be reached,
+        DEFAULT_COMPUTE_SHAPES is returned and nothing is cached.
+        
         Returns:
             List of compute shapes
         """
+        # Get the tenancy ID
+        tenancy_id = self.config.get("tenancy")
+        
+        cached = self._compute_shapes_cache.get(tenancy_id)
+        if cached is not None and time.monotonic() - cached[0] < COMPUTE_SHAPES_CACHE_TTL_SECONDS:
+            return cached[1]
+        
         try:
-            # Get the tenancy ID
-            tenancy_id = self.config.get("tenancy")
-            
             # List shapes
             response = self.compute_client.list_shapes(compartment_id=tenancy_id)
             
             # Extract shape information
-            shapes = []
-            for shape in response.data:
-                shapes.append({
-                    "shape": shape.shape,
-                    "ocpus": getattr(shape, "ocpus", None),
-                    "memory_in_gbs": getattr(shape, "memory_in_gbs", None),
-                    "networking_bandwidth_in_gbps": getattr(shape, "networking_bandwidth_in_gbps", None),
-                    "max_vnic_attachments": getattr(shape, "max_vnic_attachments", None),
-                    "gpus": getattr(shape, "gpus", None),
-                    "local_disks": getattr(shape, "local_disks", None),
-                    "local_disks_total_size_in_gbs": getattr(shape, "local_disks_total_size_in_gbs", None),
-                    "processor_description": getattr(shape, "processor_description", None),
-                })
+            shapes = [dict(zip(_SHAPE_FIELDS, _get_shape_fields(shape))) for shape in response.data]
             
+            self._compute_shapes_cache[tenancy_id] = (time.monotonic(), shapes)
             return shapes
         except Exception as e:
-            self.logger.error(f"Error fetching compute shapes: {str(e)}")
+            self.logger.error("Error fetching compute shapes: %s", e)
             # Return some default shapes for demonstration purposes
-            return [
-                {
-                    "shape": "VM.Standard.E4.Flex",
-                    "ocpus": "1-64",
-                    "memory_in_gbs": "16-1024",
-                    "processor_description": "2.55 GHz AMD EPYC™ 7J13",
-                },
-                {
-                    "shape": "VM.Standard.E3.Flex",
-                    "ocpus": "1-64",
-                    "memory_in_gbs": "16-1024",
-                    "processor_description": "2.25 GHz AMD EPYC™ 7742",
-                },
-                {
-                    "shape": "VM.Standard.A1.Flex",
-                    "ocpus": "1-80",
-                    "memory_in_gbs": "6-512",
-                    "processor_description": "Ampere® Altra® Q80-30",
-                },
-                {
-                    "shape": "VM.Standard2.1",
-                    "ocpus": 1,
-                    "memory_in_gbs": 15,
-                    "processor_description": "2.0 GHz Intel® Xeon® Platinum 8167M",
-                },
-            ]
-
-    def create_vcn(self, compartment_id: str, vcn_name: str, cidr_block: str) -> Dict[str, Any]:
+            return DEFAULT_COMPUTE_SHAPES
+
+    def clear_compute_shapes_cache(self) -> None:
+        """Drop the cached compute shapes so the next call fetches them from OCI"""
+        self._compute_shapes_cache.clear()
+
+    async def create_vcn(self, compartment_id: str, vcn_name: str, cidr_block: str) -> Dict[str, Any]:
         """
         Create a Virtual Cloud Network (VCN)
         
@@ -187,24 +379,23 @@ class OCIClient:
         Returns:
             Dictionary containing VCN details
         """
+        import oci
+        
         try:
             # Create VCN details
             vcn_details = oci.core.models.CreateVcnDetails(
                 compartment_id=compartment_id,
                 display_name=vcn_name,
                 cidr_block=cidr_block,
-                dns_label=vcn_name.lower().replace("-", "")[:15],
+                dns_label=vcn_name.translate(_DNS_LABEL_TABLE)[:DNS_LABEL_MAX_LENGTH],
             )
             
             # Create VCN
-            response = self.network_client.create_vcn(vcn_details)
+            response = await self._run_blocking(self.network_client.create_vcn, vcn_details)
             
             # Wait for VCN to be available
-            get_vcn_response = oci.wait_until(
-                self.network_client,
-                self.network_client.get_vcn(response.data.id),
-                "lifecycle_state",
-                "AVAILABLE",
+            get_vcn_response = await self._wait_for_state(
+                self.network_client, self.network_client.get_vcn, response.data.id, "AVAILABLE"
             )
             
             vcn = get_vcn_response.data
@@ -217,10 +408,10 @@ class OCIClient:
                 "lifecycle_state": vcn.lifecycle_state,
             }
         except Exception as e:
-            self.logger.error(f"Error creating VCN: {str(e)}")
+            self.logger.error("Error creating VCN: %s", e)
             raise
 
-    def create_subnet(
+    async def create_subnet(
         self, compartment_id: str, vcn_id: str, subnet_name: str, cidr_block: str
     ) -> Dict[str, Any]:
         """
@@ -235,6 +426,8 @@ class OCIClient:
         Returns:
             Dictionary containing subnet details
         """
+        import oci
+        
         try:
             # Create subnet details
             subnet_details = oci.core.models.CreateSubnetDetails(
@@ -242,18 +435,15 @@ class OCIClient:
                 vcn_id=vcn_id,
                 display_name=subnet_name,
                 cidr_block=cidr_block,
-                dns_label=subnet_name.lower().replace("-", "")[:15],
+                dns_label=subnet_name.translate(_DNS_LABEL_TABLE)[:DNS_LABEL_MAX_LENGTH],
             )
             
             # Create subnet
-            response = self.network_client.create_subnet(subnet_details)
+            response = await self._run_blocking(self.network_client.create_subnet, subnet_details)
             
             # Wait for subnet to be available
-            get_subnet_response = oci.wait_until(
-                self.network_client,
-                self.network_client.get_subnet(response.data.id),
-                "lifecycle_state",
-                "AVAILABLE",
+            get_subnet_response = await self._wait_for_state(
+                self.network_client, self.network_client.get_subnet, response.data.id, "AVAILABLE"
             )
             
             subnet = get_subnet_response.data
@@ -266,10 +456,10 @@ class OCIClient:
                 "lifecycle_state": subnet.lifecycle_state,
             }
         except Exception as e:
-            self.logger.error(f"Error creating subnet: {str(e)}")
+            self.logger.error("Error creating subnet: %s", e)
             raise
 
-    def launch_instance(
+    async def launch_instance(
         self,
         compartment_id: str,
         subnet_id: str,
@@ -296,6 +486,8 @@ class OCIClient:
         Returns:
             Dictionary containing instance details
         """
+        import oci
+        
         try:
             # Create source details
             source_details = oci.core.models.InstanceSourceViaImageDetails(
@@ -330,26 +522,27 @@ class OCIClient:
             )
             
             # Launch instance
-            response = self.compute_client.launch_instance(instance_details)
+            response = await self._run_blocking(self.compute_client.launch_instance, instance_details)
             
             # Wait for instance to be running
-            get_instance_response = oci.wait_until(
-                self.compute_client,
-                self.compute_client.get_instance(response.data.id),
-                "lifecycle_state",
-                "RUNNING",
+            get_instance_response = await self._wait_for_state(
+                self.compute_client, self.compute_client.get_instance, response.data.id, "RUNNING"
             )
             
             instance = get_instance_response.data
             
-            # Get VNIC attachments to get public IP
-            vnic_attachments = self.compute_client.list_vnic_attachments(
-                compartment_id=compartment_id,
-                instance_id=instance.id,
+            # Get the VNIC attachments, which are in place once the instance is running
+            vnic_attachments = (
+                await self._run_blocking(
+                    self.compute_client.list_vnic_attachments,
+                    compartment_id=compartment_id,
+                    instance_id=instance.id,
+                )
             ).data
             
+            # Get the VNIC to get public IP
             vnic_id = vnic_attachments[0].vnic_id
-            vnic = self.network_client.get_vnic(vnic_id).data
+            vnic = (await self._run_blocking(self.network_client.get_vnic, vnic_id)).data
             
             return {
                 "id": instance.id,
@@ -361,10 +554,10 @@ class OCIClient:
                 "private_ip": vnic.private_ip,
             }
         except Exception as e:
-            self.logger.error(f"Error launching instance: {str(e)}")
+            self.logger.error("Error launching instance: %s", e)
             raise
 
-    def create_autonomous_database(
+    async def create_autonomous_database(
         self,
         compartment_id: str,
         db_name: str,
@@ -391,6 +584,8 @@ class OCIClient:
         Returns:
             Dictionary containing database details
         """
+        import oci
+        
         try:
             # Create database details
             db_details = oci.database.models.CreateAutonomousDatabaseDetails(
@@ -405,13 +600,13 @@ class OCIClient:
             )
             
             # Create database
-            response = self.database_client.create_autonomous_database(db_details)
+            response = await self._run_blocking(self.database_client.create_autonomous_database, db_details)
             
             # Wait for database to be available
-            get_db_response = oci.wait_until(
+            get_db_response = await self._wait_for_state(
                 self.database_client,
-                self.database_client.get_autonomous_database(response.data.id),
-                "lifecycle_state",
+                self.database_client.get_autonomous_database,
+                response.data.id,
                 "AVAILABLE",
             )
             
@@ -426,10 +621,10 @@ class OCIClient:
                 "connection_strings": db.connection_strings.all_connection_strings,
             }
         except Exception as e:
-            self.logger.error(f"Error creating Autonomous Database: {str(e)}")
+            self.logger.error("Error creating Autonomous Database: %s", e)
             raise
 
-    def create_block_volume(
+    async def create_block_volume(
         self,
         compartment_id: str,
         display_name: str,
@@ -448,6 +643,8 @@ class OCIClient:
         Returns:
             Dictionary containing volume details
         """
+        import oci
+        
         try:
             # Create volume details
             volume_details = oci.core.models.CreateVolumeDetails(
@@ -461,14 +658,11 @@ class OCIClient:
                 volume_details.vpus_per_gb = vpus_per_gb
             
             # Create volume
-            response = self.block_storage_client.create_volume(volume_details)
+            response = await self._run_blocking(self.block_storage_client.create_volume, volume_details)
             
             # Wait for volume to be available
-            get_volume_response = oci.wait_until(
-                self.block_storage_client,
-                self.block_storage_client.get_volume(response.data.id),
-                "lifecycle_state",
-                "AVAILABLE",
+            get_volume_response = await self._wait_for_state(
+                self.block_storage_client, self.block_storage_client.get_volume, response.data.id, "AVAILABLE"
             )
             
             volume = get_volume_response.data
@@ -481,10 +675,10 @@ class OCIClient:
                 "time_created": volume.time_created.isoformat(),
             }
         except Exception as e:
-            self.logger.error(f"Error creating block volume: {str(e)}")
+            self.logger.error("Error creating block volume: %s", e)
             raise
 
-    def create_load_balancer(
+    async def create_load_balancer(
         self,
         compartment_id: str,
         display_name: str,
@@ -507,6 +701,8 @@ class OCIClient:
         Returns:
             Dictionary containing load balancer details
         """
+        import oci
+        
         try:
             # Create shape details if provided
             lb_shape_details = None
@@ -527,16 +723,16 @@ class OCIClient:
             )
             
             # Create load balancer
-            response = self.load_balancer_client.create_load_balancer(lb_details)
+            response = await self._run_blocking(self.load_balancer_client.create_load_balancer, lb_details)
             
             # Get the work request ID
             work_request_id = response.headers["opc-work-request-id"]
             
             # Wait for the work request to complete
-            work_request_response = oci.wait_until(
+            work_request_response = await self._wait_for_state(
                 self.load_balancer_client,
-                self.load_balancer_client.get_work_request(work_request_id),
-                "lifecycle_state",
+                self.load_balancer_client.get_work_request,
+                work_request_id,
                 "SUCCEEDED",
             )
             
@@ -551,7 +747,7 @@ class OCIClient:
                 raise Exception("Failed to get load balancer ID from work request")
             
             # Get load balancer details
-            lb = self.load_balancer_client.get_load_balancer(lb_id).data
+            lb = (await self._run_blocking(self.load_balancer_client.get_load_balancer, lb_id)).data
             
             return {
                 "id": lb.id,
@@ -562,10 +758,10 @@ class OCIClient:
                 "time_created": lb.time_created.isoformat(),
             }
         except Exception as e:
-            self.logger.error(f"Error creating load balancer: {str(e)}")
+            self.logger.error("Error creating load balancer: %s", e)
             raise
 
-    def create_bucket(
+    async def create_bucket(
         self,
         compartment_id: str,
         namespace_name: str,
@@ -586,6 +782,8 @@ class OCIClient:
         Returns:
             Dictionary containing bucket details
         """
+        import oci
+        
         try:
             # Create bucket details
             bucket_details = oci.object_storage.models.CreateBucketDetails(
@@ -596,7 +794,8 @@ class OCIClient:
             )
             
             # Create bucket
-            response = self.object_storage_client.create_bucket(
+            response = await self._run_blocking(
+                self.object_storage_client.create_bucket,
                 namespace_name=namespace_name,
                 create_bucket_details=bucket_details,
             )
@@ -612,19 +811,25 @@ class OCIClient:
                 "time_created": bucket.time_created.isoformat(),
             }
         except Exception as e:
-            self.logger.error(f"Error creating bucket: {str(e)}")
+            self.logger.error("Error creating bucket: %s", e)
             raise
 
     def get_namespace(self) -> str:
         """
         Get the object storage namespace
         
+        The namespace never changes for a tenancy, so it is fetched once.
+        
         Returns:
             Namespace name
         """
+        if self._namespace is not None:
+            return self._namespace
+        
         try:
             response = self.object_storage_client.get_namespace()
-            return response.data
+            self._namespace = response.data
+            return self._namespace
         except Exception as e:
-            self.logger.error(f"Error getting namespace: {str(e)}")
+            self.logger.error("Error getting namespace: %s", e)
             raise
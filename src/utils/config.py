@@ -3,30 +3,63 @@ Configuration utilities for the OCI MCP Server
 """
 import logging
 import os
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed configuration files keyed by absolute path, with the (mtime_ns, size) they were parsed at
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 16
+
+# Path of the most recently loaded configuration, reloaded by get_oci_config
+_LOADED_PATH: Optional[str] = None
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from YAML file
     
+    Parsed files are cached until their modification time or size changes, so the
+    returned dictionary is shared and must not be mutated.
+    
     Args:
         config_path: Path to the configuration file
         
     Returns:
         Dictionary containing configuration values
     """
+    global _LOADED_PATH
     logger = logging.getLogger(__name__)
     
     try:
-        with open(config_path, "r") as config_file:
-            config = yaml.safe_load(config_file)
-            logger.info(f"Configuration loaded from {config_path}")
-            return config
+        abs_path = os.path.abspath(config_path)
+        stat = os.stat(abs_path)
+        
+        cached = _CONFIG_CACHE.get(abs_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _CONFIG_CACHE.move_to_end(abs_path)
+            _LOADED_PATH = abs_path
+            return cached[2]
+        
+        with open(abs_path, "r") as config_file:
+            config = yaml.load(config_file, Loader=_Loader)
+            logger.info("Configuration loaded from %s", config_path)
+        
+        _CONFIG_CACHE[abs_path] = (stat.st_mtime_ns, stat.st_size, config)
+        _CONFIG_CACHE.move_to_end(abs_path)
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+        _LOADED_PATH = abs_path
+        return config
     except Exception as e:
-        logger.error(f"Error loading configuration from {config_path}: {str(e)}")
+        logger.error("Error loading configuration from %s: %s", config_path, e)
         # Return default configuration
         return {
             "server": {
@@ -45,12 +78,18 @@ def get_oci_config() -> Dict[str, Any]:
     """
     Get OCI configuration from the loaded config
     
+    Goes through load_config for the most recently loaded file, so edits to it are
+    picked up while an unchanged file is not parsed again. Falls back to CONFIG_PATH
+    if no configuration has been loaded yet.
+    
     Returns:
         Dictionary containing OCI configuration
     """
-    config_path = os.environ.get("CONFIG_PATH", "config.yaml")
-    if not os.path.exists(config_path):
-        config_path = "config.example.yaml"
+    config_path = _LOADED_PATH
+    if config_path is None:
+        config_path = os.environ.get("CONFIG_PATH", "config.yaml")
+        if not os.path.exists(config_path):
+            config_path = "config.example.yaml"
     
     config = load_config(config_path)
     return config.get("oci", {})
@@ -1,27 +1,98 @@
 """
 Logging utilities for the OCI MCP Server
 """
+import atexit
+import copy
+import gzip
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import shutil
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+# Shared by the console and file handlers
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Background listener that writes queued records to the real handlers
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshot the message in the calling thread and leave the rest to the listener
+        
+        Merging the arguments here means later changes to mutable arguments cannot
+        reach the log, while the formatter and any traceback run on the listener.
+        
+        Args:
+            record: Record being logged
+            
+        Returns:
+            Copy of the record with its message merged and no arguments
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _gzip_namer(name: str) -> str:
+    """Name rotated log files with a .gz suffix"""
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """
+    Compress the current log file into its first backup
+    
+    Args:
+        source: Path to the log file being rotated
+        dest: Path of the compressed backup to create
+    """
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
 
 
 def setup_logger(log_file: str, log_level: str = "INFO") -> None:
     """
     Set up the application logger
     
+    The calling thread only merges each record's message and puts it on a queue. A
+    background listener thread formats and writes it to the console and log file, so
+    logging never blocks on I/O.
+    
     Args:
-        log_file: Path to the log file
+        log_file: Path to the log file; its directory must already exist
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    # Create log directory if it doesn't exist
-    log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    global _listener
     
     # Convert string log level to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
+    # Thread and process details are not part of the format, so skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
@@ -29,15 +100,18 @@ def setup_logger(log_file: str, log_level: str = "INFO") -> None:
     # Remove existing handlers to avoid duplicate logs
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_listener()
+    
+    # Records queued before the listener starts are written once it does
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
+    handlers = []
     
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
-    console_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(_FORMATTER)
+    handlers.append(console_handler)
     
     # Create file handler
     try:
@@ -46,17 +120,21 @@ def setup_logger(log_file: str, log_level: str = "INFO") -> None:
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5
         )
+        # Rollover runs on the listener thread, so compressing backups never blocks callers
+        file_handler.namer = _gzip_namer
+        file_handler.rotator = _gzip_rotator
         file_handler.setLevel(numeric_level)
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_format)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
     except Exception as e:
-        logging.error(f"Failed to create file handler: {str(e)}")
+        logging.error("Failed to create file handler: %s", e)
         logging.warning("Continuing with console logging only")
     
-    logging.info(f"Logger initialized with level {log_level}")
+    # The listener thread owns the console and file handlers
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    logging.info("Logger initialized with level %s", log_level)
 
 
 def get_logger(name: str) -> logging.Logger:
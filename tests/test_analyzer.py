@@ -1,109 +1,150 @@
 """
 Tests for the Resource Analyzer
 """
-import sys
-import os
 import unittest
 from typing import List
 
-# Add the src directory to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from api.schemas import ConversationMessage, OCIResource
+from core.analyzer import ExtractedInfo, ResourceAnalyzer
 
-from src.api.schemas import ConversationMessage, OCIResource
-from src.core.analyzer import ResourceAnalyzer
+# Sample conversations, built once and shared read-only by the test cases
+STATIC_SITE_CONVERSATION = (
+    ConversationMessage(
+        role="user",
+        content="I need to host a simple static website with low traffic."
+    ),
+    ConversationMessage(
+        role="assistant",
+        content="I can help you with that. What kind of content will your website have?"
+    ),
+    ConversationMessage(
+        role="user",
+        content="Just some HTML pages, CSS, and images. Nothing complex."
+    ),
+)
+
+ECOMMERCE_CONVERSATION = (
+    ConversationMessage(
+        role="user",
+        content="I want to set up an e-commerce store with a database. I expect moderate traffic."
+    ),
+    ConversationMessage(
+        role="assistant",
+        content="I can help you with that. What kind of products will you be selling?"
+    ),
+    ConversationMessage(
+        role="user",
+        content="Clothing and accessories. I'll need about 500GB of storage."
+    ),
+)
+
+RAW_TUPLE_CONVERSATION = (
+    ("user", "I need to host a simple static website with low traffic.", None),
+    ("assistant", "What kind of content will your website have?", None),
+)
+
+SCALABLE_ECOMMERCE_CONVERSATION = (
+    ConversationMessage(
+        role="user",
+        content="I need to host an e-commerce website with a database. I expect high traffic and need it to scale automatically."
+    ),
+    ConversationMessage(
+        role="assistant",
+        content="I can help you with that. What kind of database do you need?"
+    ),
+    ConversationMessage(
+        role="user",
+        content="I need a relational database for storing product information and customer orders."
+    ),
+    ConversationMessage(
+        role="assistant",
+        content="How much storage do you think you'll need?"
+    ),
+    ConversationMessage(
+        role="user",
+        content="I'll need about 500GB of storage for products, images, and other data."
+    ),
+)
+
+WHITESPACE_CONVERSATION = (("user", "   ", None),)
+
+# (name, conversation, expected ExtractedInfo fields) for test_extract_information
+EXTRACTION_CASES = (
+    (
+        "static website",
+        STATIC_SITE_CONVERSATION,
+        {"website_type": "static", "expected_traffic": "low"},
+    ),
+    (
+        "e-commerce",
+        ECOMMERCE_CONVERSATION,
+        {
+            "website_type": "ecommerce",
+            "expected_traffic": "medium",
+            "database_needs": "general",
+            "storage_requirements": 500,
+        },
+    ),
+    (
+        "raw tuples",
+        RAW_TUPLE_CONVERSATION,
+        {"website_type": "static", "expected_traffic": "low"},
+    ),
+)
+
+# (name, extracted information, expected compute requirements) for test_determine_compute_requirements
+COMPUTE_CASES = (
+    (
+        "static website with low traffic",
+        ExtractedInfo(website_type="static", expected_traffic="low"),
+        {"shape": "VM.Standard.E2.1.Micro", "instance_count": 1},
+    ),
+    (
+        "e-commerce with high traffic",
+        ExtractedInfo(
+            website_type="ecommerce",
+            expected_traffic="high",
+            database_needs="relational",
+            storage_requirements=500,
+            scaling_needs="required",
+        ),
+        {"shape": "VM.Standard.E4.Flex", "instance_count": 2, "autoscaling": True},
+    ),
+)
 
 
 class TestResourceAnalyzer(unittest.TestCase):
     """Test cases for the ResourceAnalyzer class"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.analyzer = ResourceAnalyzer()
-
-    def test_extract_information_static_website(self):
-        """Test extracting information for a static website"""
-        # Create test conversation context
-        conversation = [
-            ConversationMessage(
-                role="user",
-                content="I need to host a simple static website with low traffic."
-            ),
-            ConversationMessage(
-                role="assistant",
-                content="I can help you with that. What kind of content will your website have?"
-            ),
-            ConversationMessage(
-                role="user",
-                content="Just some HTML pages, CSS, and images. Nothing complex."
-            )
-        ]
-        
-        # Extract information
-        extracted_info = self.analyzer._extract_information(conversation)
-        
-        # Verify extraction
-        self.assertEqual(extracted_info["website_type"], "static")
-        self.assertEqual(extracted_info["expected_traffic"], "low")
-
-    def test_extract_information_ecommerce(self):
-        """Test extracting information for an e-commerce website"""
-        # Create test conversation context
-        conversation = [
-            ConversationMessage(
-                role="user",
-                content="I want to set up an e-commerce store with a database. I expect moderate traffic."
-            ),
-            ConversationMessage(
-                role="assistant",
-                content="I can help you with that. What kind of products will you be selling?"
-            ),
-            ConversationMessage(
-                role="user",
-                content="Clothing and accessories. I'll need about 500GB of storage."
-            )
-        ]
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all test cases"""
+        # The analyzer holds no per-test state, so one instance serves the whole class
+        cls.analyzer = ResourceAnalyzer()
+
+    def test_extract_information(self):
+        """Test extracting information from sample conversations"""
+        for name, conversation, expected in EXTRACTION_CASES:
+            with self.subTest(name):
+                extracted_info = self.analyzer._extract_information(conversation)
+                for field, value in expected.items():
+                    self.assertEqual(getattr(extracted_info, field), value, field)
+
+    def test_extract_information_empty(self):
+        """Test extracting information from an empty conversation"""
         # Extract information
-        extracted_info = self.analyzer._extract_information(conversation)
+        extracted_info = self.analyzer._extract_information(WHITESPACE_CONVERSATION)
         
-        # Verify extraction
-        self.assertEqual(extracted_info["website_type"], "ecommerce")
-        self.assertEqual(extracted_info["expected_traffic"], "medium")
-        self.assertEqual(extracted_info["database_needs"], "general")
-        self.assertEqual(extracted_info["storage_requirements"], 500)
+        # Verify nothing was extracted
+        self.assertEqual(extracted_info, ExtractedInfo())
 
     def test_determine_compute_requirements(self):
         """Test determining compute requirements"""
-        # Test for static website with low traffic
-        extracted_info = {
-            "website_type": "static",
-            "expected_traffic": "low",
-            "database_needs": None,
-            "storage_requirements": None,
-            "scaling_needs": None,
-        }
-        
-        compute_req = self.analyzer._determine_compute_requirements(extracted_info)
-        
-        # Verify requirements
-        self.assertEqual(compute_req["shape"], "VM.Standard.E2.1.Micro")
-        self.assertEqual(compute_req["instance_count"], 1)
-        
-        # Test for e-commerce with high traffic
-        extracted_info = {
-            "website_type": "ecommerce",
-            "expected_traffic": "high",
-            "database_needs": "relational",
-            "storage_requirements": 500,
-            "scaling_needs": "required",
-        }
-        
-        compute_req = self.analyzer._determine_compute_requirements(extracted_info)
-        
-        # Verify requirements
-        self.assertEqual(compute_req["shape"], "VM.Standard.E4.Flex")
-        self.assertEqual(compute_req["instance_count"], 2)
-        self.assertTrue(compute_req["autoscaling"])
+        for name, extracted_info, expected in COMPUTE_CASES:
+            with self.subTest(name):
+                compute_req = self.analyzer._determine_compute_requirements(extracted_info)
+                for key, value in expected.items():
+                    self.assertEqual(compute_req[key], value, key)
 
     def test_generate_recommendations(self):
         """Test generating resource recommendations"""
@@ -168,32 +209,8 @@ class TestResourceAnalyzer(unittest.TestCase):
 
     def test_analyze_requirements(self):
         """Test the full analyze_requirements method"""
-        # Create test conversation context
-        conversation = [
-            ConversationMessage(
-                role="user",
-                content="I need to host an e-commerce website with a database. I expect high traffic and need it to scale automatically."
-            ),
-            ConversationMessage(
-                role="assistant",
-                content="I can help you with that. What kind of database do you need?"
-            ),
-            ConversationMessage(
-                role="user",
-                content="I need a relational database for storing product information and customer orders."
-            ),
-            ConversationMessage(
-                role="assistant",
-                content="How much storage do you think you'll need?"
-            ),
-            ConversationMessage(
-                role="user",
-                content="I'll need about 500GB of storage for products, images, and other data."
-            )
-        ]
-        
         # Analyze requirements
-        recommendations = self.analyzer.analyze_requirements(conversation)
+        recommendations = self.analyzer.analyze_requirements(SCALABLE_ECOMMERCE_CONVERSATION)
         
         # Verify recommendations
         self.assertIsInstance(recommendations, list)
@@ -210,6 +227,23 @@ class TestResourceAnalyzer(unittest.TestCase):
         self.assertIn("database", resource_types)
         self.assertIn("storage", resource_types)
 
+    def test_analyze_requirements_returns_copies(self):
+        """Test that modifying returned recommendations does not affect later analyses"""
+        analyzer = ResourceAnalyzer()
+        first = analyzer.analyze_requirements(SCALABLE_ECOMMERCE_CONVERSATION)
+        expected = [r.model_dump() for r in first]
+        
+        # Modify the nested specifications and dependencies of the first result
+        for recommendation in first:
+            recommendation.specifications["modified"] = True
+            recommendation.dependencies.append("Modified")
+        network_rec = next(r for r in first if r.resource_type == "network")
+        network_rec.specifications["security_list_rules"][0]["port"] = 8080
+        
+        # Verify a repeated analysis is unaffected
+        second = analyzer.analyze_requirements(SCALABLE_ECOMMERCE_CONVERSATION)
+        self.assertEqual([r.model_dump() for r in second], expected)
+
 
 if __name__ == "__main__":
     unittest.main()
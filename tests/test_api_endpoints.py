@@ -2,22 +2,215 @@
 """
 Test script for OCI MCP Server API endpoints
 This script simulates API calls to test the server's functionality
+
+The analyze -> provision -> status chain is a graph of session-scoped fixtures, so
+each step runs once however many tests consume it. Run with "pytest -s" to see the
+per-endpoint output.
 """
-import json
 import os
+import re
 import sys
 import uuid
-from typing import Dict, List, Any
-
-# Add the parent directory to the path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from typing import Callable, Dict, Iterator, List, Any, Tuple
 
+import orjson
+import pytest
 import requests
-from src.api.schemas import ChatbotRequest, ConversationMessage, ProvisioningConfirmation
+import responses
+from requests.adapters import HTTPAdapter
+
+from api.schemas import ChatbotRequest, ConversationMessage, ProvisioningConfirmation
 
 # Configuration
 MCP_SERVER_URL = "http://localhost:8000"
 
+# Set MCP_TEST_OFFLINE=1 to serve the mock payloads below instead of calling a running server;
+# otherwise the tests are skipped when no server is reachable
+OFFLINE = os.environ.get("MCP_TEST_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# Set MCP_TEST_VERBOSE=1 to print full request and response payloads
+VERBOSE = os.environ.get("MCP_TEST_VERBOSE", "").lower() in ("1", "true", "yes")
+
+# (connect, read) timeout in seconds for every call, so an unreachable or stuck server
+# fails fast instead of hanging; provisioning answers only after ~1s per dependency level
+TIMEOUT = (2.0, 10.0)
+
+# One keep-alive session reused by every test, so the calls share a connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Mock endpoint payloads, without the request_id that is echoed back per request
+MOCK_ANALYZE_RESULT = {
+    "recommendations": [
+        {
+            "resource_type": "database",
+            "name": "CustomerDB",
+            "description": "Autonomous Database for customer information",
+            "specifications": {
+                "type": "autonomous",
+                "workload_type": "OLTP",
+                "storage_in_tbs": 1,
+                "cpu_core_count": 1,
+            },
+            "estimated_cost": {
+                "monthly": 900.0,
+                "currency": "USD",
+            },
+        },
+        {
+            "resource_type": "network",
+            "name": "DatabaseVCN",
+            "description": "Virtual Cloud Network for database access",
+            "specifications": {
+                "vcn_cidr": "10.0.0.0/16",
+                "subnet_cidr": "10.0.0.0/24",
+                "security_list_rules": [
+                    {"protocol": "6", "port": 1521, "source": "0.0.0.0/0"},
+                ],
+            },
+            "estimated_cost": {
+                "monthly": 0.0,
+                "currency": "USD",
+            },
+        },
+    ],
+    "message": "Resource analysis completed successfully",
+}
+
+MOCK_PROVISION_RESULT = {
+    "status": "success",
+    "provisioned_resources": [
+        {
+            "resource_type": "database",
+            "name": "CustomerDB",
+            "ocid": "ocid1.autonomousdatabase.oc1..example",
+            "status": "provisioning",
+            "details": {
+                "type": "autonomous",
+                "workload_type": "OLTP",
+                "time_created": "2023-10-25T12:34:56.789Z",
+            },
+            "access_info": {
+                "connection_strings": {
+                    "high": "customerdb_high",
+                    "medium": "customerdb_medium",
+                    "low": "customerdb_low",
+                },
+            },
+        },
+        {
+            "resource_type": "network",
+            "name": "DatabaseVCN",
+            "ocid": "ocid1.vcn.oc1..example",
+            "status": "active",
+            "details": {
+                "vcn_cidr": "10.0.0.0/16",
+                "time_created": "2023-10-25T12:34:56.789Z",
+            },
+        },
+    ],
+    "message": "Resources provisioning initiated",
+}
+
+MOCK_STATUS_RESULT = {
+    "status": "in_progress",
+    "progress": 50.0,
+    "resources": [
+        {
+            "name": "CustomerDB",
+            "type": "database",
+            "status": "provisioning",
+            "ocid": "ocid1.autonomousdatabase.oc1..example",
+        },
+        {
+            "name": "DatabaseVCN",
+            "type": "network",
+            "status": "active",
+            "ocid": "ocid1.vcn.oc1..example",
+        },
+    ],
+    "started_at": "2023-10-25T12:34:56.789Z",
+    "estimated_completion": "2023-10-25T12:49:56.789Z",
+    "message": "Provisioning in progress",
+}
+
+MOCK_RESOURCE_TYPES_RESULT = {
+    "resource_types": [
+        {
+            "type": "compute",
+            "display_name": "Compute Instance",
+            "description": "Virtual machines for running applications",
+            "available_shapes": [
+                "VM.Standard.E2.1.Micro",
+                "VM.Standard.E2.1",
+                "VM.Standard.E2.2",
+            ],
+        },
+        {
+            "type": "database",
+            "display_name": "Database",
+            "description": "Managed database services",
+            "subtypes": [
+                {
+                    "type": "autonomous",
+                    "display_name": "Autonomous Database",
+                    "description": "Self-driving, self-securing, self-repairing database",
+                },
+                {
+                    "type": "mysql",
+                    "display_name": "MySQL Database",
+                    "description": "Fully managed MySQL database service",
+                },
+            ],
+        },
+        {
+            "type": "network",
+            "display_name": "Virtual Cloud Network",
+            "description": "Software-defined network for OCI resources",
+        },
+        {
+            "type": "storage",
+            "display_name": "Block Storage",
+            "description": "Block volumes for compute instances",
+        },
+        {
+            "type": "load_balancer",
+            "display_name": "Load Balancer",
+            "description": "Distribute incoming traffic across multiple instances",
+        },
+    ],
+}
+
+
+def _echo_request_id(payload: Dict[str, Any]) -> Callable[[requests.PreparedRequest], Tuple[int, Dict[str, str], bytes]]:
+    """Build a stub callback that returns the payload with the request's request_id"""
+    def callback(request: requests.PreparedRequest) -> Tuple[int, Dict[str, str], bytes]:
+        if request.method == "POST":
+            request_id = orjson.loads(request.body)["request_id"]
+        else:
+            request_id = request.path_url.rsplit("/", 1)[-1]
+        return 200, {}, orjson.dumps({"request_id": request_id, **payload})
+    
+    return callback
+
+
+def stub_endpoints() -> responses.RequestsMock:
+    """
+    Stub the MCP server endpoints at the transport layer with the mock payloads
+    
+    Returns:
+        Mock to use as a context manager; no request inside it touches the network
+    """
+    mock = responses.RequestsMock(assert_all_requests_are_fired=False)
+    for method, url, payload in (
+        (responses.POST, f"{MCP_SERVER_URL}/api/analyze", MOCK_ANALYZE_RESULT),
+        (responses.POST, f"{MCP_SERVER_URL}/api/provision", MOCK_PROVISION_RESULT),
+        (responses.GET, re.compile(re.escape(f"{MCP_SERVER_URL}/api/status/") + ".+"), MOCK_STATUS_RESULT),
+    ):
+        mock.add_callback(method, url, callback=_echo_request_id(payload), content_type="application/json")
+    mock.add(responses.GET, f"{MCP_SERVER_URL}/api/resource-types", json=MOCK_RESOURCE_TYPES_RESULT)
+    return mock
+
 
 def print_section(title: str) -> None:
     """Print a section title"""
@@ -26,12 +219,45 @@ def print_section(title: str) -> None:
     print("=" * 80 + "\n")
 
 
-def test_analyze_endpoint() -> Dict[str, Any]:
-    """Test the /api/analyze endpoint"""
-    print_section("Testing /api/analyze Endpoint")
+def print_payload(label: str, payload: Any) -> None:
+    """Pretty-print a request or response payload when running verbosely"""
+    if VERBOSE:
+        print(f"\n{label}:")
+        print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
+
+
+@pytest.fixture(scope="session")
+def mcp_server() -> Iterator[None]:
+    """Send requests to the running MCP server, or to the stubbed endpoints when offline"""
+    if OFFLINE:
+        with stub_endpoints():
+            yield
+        return
     
-    # Create a request ID
-    request_id = str(uuid.uuid4())
+    try:
+        SESSION.get(f"{MCP_SERVER_URL}/health", timeout=TIMEOUT)
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        pytest.skip(f"MCP server not reachable at {MCP_SERVER_URL}: {e}")
+    yield
+
+
+@pytest.fixture(scope="session")
+def request_id() -> str:
+    """Create the request ID shared by the analyze, provision and status tests"""
+    return str(uuid.uuid4())
+
+
+def send_analyze_request(request_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Send an analysis request to the MCP server and parse the response"""
+    response = SESSION.post(f"{MCP_SERVER_URL}/api/analyze", json=request_json, timeout=TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def analysis_result(mcp_server: None, request_id: str) -> Dict[str, Any]:
+    """Call the /api/analyze endpoint once for the session"""
+    print_section("Testing /api/analyze Endpoint")
     print(f"Request ID: {request_id}")
     
     # Create a sample conversation
@@ -58,8 +284,8 @@ def test_analyze_endpoint() -> Dict[str, Any]:
         ),
     ]
     
-    # Create the request
-    request = ChatbotRequest(
+    # Create the request; the inputs are known-good constants, so skip validation
+    request = ChatbotRequest.model_construct(
         request_id=request_id,
         conversation_context=conversation,
         user_preferences={
@@ -68,81 +294,34 @@ def test_analyze_endpoint() -> Dict[str, Any]:
         }
     )
     
-    # Convert to JSON for printing
-    request_json = json.loads(request.json())
-    print("\nSending request to /api/analyze:")
-    print(json.dumps(request_json, indent=2))
+    # Convert to JSON-compatible data for sending and printing
+    request_json = request.model_dump(mode="json")
+    print_payload("Sending request to /api/analyze", request_json)
     
-    try:
-        # Send the request to the MCP server
-        response = requests.post(
-            f"{MCP_SERVER_URL}/api/analyze",
-            json=request_json,
-        )
-        
-        # Check if the request was successful
-        response.raise_for_status()
-        
-        # Parse the response
-        result = response.json()
-        print("\nReceived response from /api/analyze:")
-        print(json.dumps(result, indent=2))
-        
-        # Validate the response
-        assert "request_id" in result, "Response missing request_id"
-        assert "recommendations" in result, "Response missing recommendations"
-        
-        print("\n✅ /api/analyze endpoint test passed")
-        return result
-    except requests.exceptions.RequestException as e:
-        print(f"\n❌ Error sending request to /api/analyze: {str(e)}")
-        print("Returning mock response for testing purposes")
-        
-        # Return a mock response for testing purposes
-        return {
-            "request_id": request_id,
-            "recommendations": [
-                {
-                    "resource_type": "database",
-                    "name": "CustomerDB",
-                    "description": "Autonomous Database for customer information",
-                    "specifications": {
-                        "type": "autonomous",
-                        "workload_type": "OLTP",
-                        "storage_in_tbs": 1,
-                        "cpu_core_count": 1,
-                    },
-                    "estimated_cost": {
-                        "monthly": 900.0,
-                        "currency": "USD",
-                    },
-                },
-                {
-                    "resource_type": "network",
-                    "name": "DatabaseVCN",
-                    "description": "Virtual Cloud Network for database access",
-                    "specifications": {
-                        "vcn_cidr": "10.0.0.0/16",
-                        "subnet_cidr": "10.0.0.0/24",
-                        "security_list_rules": [
-                            {"protocol": "6", "port": 1521, "source": "0.0.0.0/0"},
-                        ],
-                    },
-                    "estimated_cost": {
-                        "monthly": 0.0,
-                        "currency": "USD",
-                    },
-                },
-            ],
-            "message": "Resource analysis completed successfully",
-        }
-    except AssertionError as e:
-        print(f"\n❌ Validation error: {str(e)}")
-        raise
+    # Send the request to the MCP server
+    result = send_analyze_request(request_json)
+    print_payload("Received response from /api/analyze", result)
+    return result
 
 
-def test_provision_endpoint(analysis_result: Dict[str, Any]) -> Dict[str, Any]:
-    """Test the /api/provision endpoint"""
+def test_analyze_endpoint(analysis_result: Dict[str, Any]) -> None:
+    """Test the /api/analyze endpoint"""
+    assert "request_id" in analysis_result, "Response missing request_id"
+    assert "recommendations" in analysis_result, "Response missing recommendations"
+    
+    print("\n✅ /api/analyze endpoint test passed")
+
+
+def send_provision_request(confirmation_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a provisioning confirmation to the MCP server and parse the response"""
+    response = SESSION.post(f"{MCP_SERVER_URL}/api/provision", json=confirmation_json, timeout=TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def provisioning_result(analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Call the /api/provision endpoint once for the session with the analysis recommendations"""
     print_section("Testing /api/provision Endpoint")
     
     # Get the request ID and recommendations from the analysis result
@@ -158,78 +337,32 @@ def test_provision_endpoint(analysis_result: Dict[str, Any]) -> Dict[str, Any]:
         confirmed_resources=recommendations,
     )
     
-    # Convert to JSON for printing
-    confirmation_json = json.loads(confirmation.json())
-    print("\nSending request to /api/provision:")
-    print(json.dumps(confirmation_json, indent=2))
+    # Convert to JSON-compatible data for sending and printing
+    confirmation_json = confirmation.model_dump(mode="json")
+    print_payload("Sending request to /api/provision", confirmation_json)
     
-    try:
-        # Send the request to the MCP server
-        response = requests.post(
-            f"{MCP_SERVER_URL}/api/provision",
-            json=confirmation_json,
-        )
-        
-        # Check if the request was successful
-        response.raise_for_status()
-        
-        # Parse the response
-        result = response.json()
-        print("\nReceived response from /api/provision:")
-        print(json.dumps(result, indent=2))
-        
-        # Validate the response
-        assert "request_id" in result, "Response missing request_id"
-        assert "status" in result, "Response missing status"
-        
-        print("\n✅ /api/provision endpoint test passed")
-        return result
-    except requests.exceptions.RequestException as e:
-        print(f"\n❌ Error sending request to /api/provision: {str(e)}")
-        print("Returning mock response for testing purposes")
-        
-        # Return a mock response for testing purposes
-        return {
-            "request_id": request_id,
-            "status": "success",
-            "provisioned_resources": [
-                {
-                    "resource_type": "database",
-                    "name": "CustomerDB",
-                    "ocid": "ocid1.autonomousdatabase.oc1..example",
-                    "status": "provisioning",
-                    "details": {
-                        "type": "autonomous",
-                        "workload_type": "OLTP",
-                        "time_created": "2023-10-25T12:34:56.789Z",
-                    },
-                    "access_info": {
-                        "connection_strings": {
-                            "high": "customerdb_high",
-                            "medium": "customerdb_medium",
-                            "low": "customerdb_low",
-                        },
-                    },
-                },
-                {
-                    "resource_type": "network",
-                    "name": "DatabaseVCN",
-                    "ocid": "ocid1.vcn.oc1..example",
-                    "status": "active",
-                    "details": {
-                        "vcn_cidr": "10.0.0.0/16",
-                        "time_created": "2023-10-25T12:34:56.789Z",
-                    },
-                },
-            ],
-            "message": "Resources provisioning initiated",
-        }
-    except AssertionError as e:
-        print(f"\n❌ Validation error: {str(e)}")
-        raise
+    # Send the request to the MCP server
+    result = send_provision_request(confirmation_json)
+    print_payload("Received response from /api/provision", result)
+    return result
+
+
+def test_provision_endpoint(provisioning_result: Dict[str, Any]) -> None:
+    """Test the /api/provision endpoint"""
+    assert "request_id" in provisioning_result, "Response missing request_id"
+    assert "status" in provisioning_result, "Response missing status"
+    
+    print("\n✅ /api/provision endpoint test passed")
+
 
+def fetch_status(request_id: str) -> Dict[str, Any]:
+    """Fetch a provisioning request's status from the MCP server"""
+    response = SESSION.get(f"{MCP_SERVER_URL}/api/status/{request_id}", timeout=TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
-def test_status_endpoint(provisioning_result: Dict[str, Any]) -> Dict[str, Any]:
+
+def test_status_endpoint(provisioning_result: Dict[str, Any]) -> None:
     """Test the /api/status/{request_id} endpoint"""
     print_section("Testing /api/status Endpoint")
     
@@ -237,158 +370,37 @@ def test_status_endpoint(provisioning_result: Dict[str, Any]) -> Dict[str, Any]:
     request_id = provisioning_result["request_id"]
     print(f"Request ID: {request_id}")
     
-    try:
-        # Send the request to the MCP server
-        response = requests.get(f"{MCP_SERVER_URL}/api/status/{request_id}")
-        
-        # Check if the request was successful
-        response.raise_for_status()
-        
-        # Parse the response
-        result = response.json()
-        print("\nReceived response from /api/status:")
-        print(json.dumps(result, indent=2))
-        
-        # Validate the response
-        assert "request_id" in result, "Response missing request_id"
-        assert "status" in result, "Response missing status"
-        
-        print("\n✅ /api/status endpoint test passed")
-        return result
-    except requests.exceptions.RequestException as e:
-        print(f"\n❌ Error sending request to /api/status: {str(e)}")
-        print("Returning mock response for testing purposes")
-        
-        # Return a mock response for testing purposes
-        return {
-            "request_id": request_id,
-            "status": "in_progress",
-            "progress": 50.0,
-            "resources": [
-                {
-                    "name": "CustomerDB",
-                    "type": "database",
-                    "status": "provisioning",
-                    "ocid": "ocid1.autonomousdatabase.oc1..example",
-                },
-                {
-                    "name": "DatabaseVCN",
-                    "type": "network",
-                    "status": "active",
-                    "ocid": "ocid1.vcn.oc1..example",
-                },
-            ],
-            "started_at": "2023-10-25T12:34:56.789Z",
-            "estimated_completion": "2023-10-25T12:49:56.789Z",
-            "message": "Provisioning in progress",
-        }
-    except AssertionError as e:
-        print(f"\n❌ Validation error: {str(e)}")
-        raise
+    # Send the request to the MCP server
+    result = fetch_status(request_id)
+    print_payload("Received response from /api/status", result)
+    
+    # Validate the response
+    assert "request_id" in result, "Response missing request_id"
+    assert "status" in result, "Response missing status"
+    
+    print("\n✅ /api/status endpoint test passed")
 
 
-def test_resource_types_endpoint() -> Dict[str, Any]:
-    """Test the /api/resource_types endpoint"""
-    print_section("Testing /api/resource_types Endpoint")
-    
-    try:
-        # Send the request to the MCP server
-        response = requests.get(f"{MCP_SERVER_URL}/api/resource_types")
-        
-        # Check if the request was successful
-        response.raise_for_status()
-        
-        # Parse the response
-        result = response.json()
-        print("\nReceived response from /api/resource_types:")
-        print(json.dumps(result, indent=2))
-        
-        # Validate the response
-        assert "resource_types" in result, "Response missing resource_types"
-        
-        print("\n✅ /api/resource_types endpoint test passed")
-        return result
-    except requests.exceptions.RequestException as e:
-        print(f"\n❌ Error sending request to /api/resource_types: {str(e)}")
-        print("Returning mock response for testing purposes")
-        
-        # Return a mock response for testing purposes
-        return {
-            "resource_types": [
-                {
-                    "type": "compute",
-                    "display_name": "Compute Instance",
-                    "description": "Virtual machines for running applications",
-                    "available_shapes": [
-                        "VM.Standard.E2.1.Micro",
-                        "VM.Standard.E2.1",
-                        "VM.Standard.E2.2",
-                    ],
-                },
-                {
-                    "type": "database",
-                    "display_name": "Database",
-                    "description": "Managed database services",
-                    "subtypes": [
-                        {
-                            "type": "autonomous",
-                            "display_name": "Autonomous Database",
-                            "description": "Self-driving, self-securing, self-repairing database",
-                        },
-                        {
-                            "type": "mysql",
-                            "display_name": "MySQL Database",
-                            "description": "Fully managed MySQL database service",
-                        },
-                    ],
-                },
-                {
-                    "type": "network",
-                    "display_name": "Virtual Cloud Network",
-                    "description": "Software-defined network for OCI resources",
-                },
-                {
-                    "type": "storage",
-                    "display_name": "Block Storage",
-                    "description": "Block volumes for compute instances",
-                },
-                {
-                    "type": "load_balancer",
-                    "display_name": "Load Balancer",
-                    "description": "Distribute incoming traffic across multiple instances",
-                },
-            ],
-        }
-    except AssertionError as e:
-        print(f"\n❌ Validation error: {str(e)}")
-        raise
+def fetch_resource_types() -> Dict[str, Any]:
+    """Fetch the available resource types from the MCP server"""
+    response = SESSION.get(f"{MCP_SERVER_URL}/api/resource-types", timeout=TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
-def main():
-    """Main function"""
-    print_section("OCI MCP Server API Endpoint Tests")
-    print("This script tests the API endpoints of the OCI MCP Server.")
+def test_resource_types_endpoint(mcp_server: None) -> None:
+    """Test the /api/resource-types endpoint"""
+    print_section("Testing /api/resource-types Endpoint")
     
-    try:
-        # Test the /api/resource_types endpoint
-        resource_types_result = test_resource_types_endpoint()
-        
-        # Test the /api/analyze endpoint
-        analysis_result = test_analyze_endpoint()
-        
-        # Test the /api/provision endpoint
-        provisioning_result = test_provision_endpoint(analysis_result)
-        
-        # Test the /api/status endpoint
-        status_result = test_status_endpoint(provisioning_result)
-        
-        print_section("All Tests Completed")
-        print("✅ All API endpoint tests passed")
-    except Exception as e:
-        print_section("Test Failed")
-        print(f"❌ Error during testing: {str(e)}")
-        sys.exit(1)
+    # Send the request to the MCP server
+    result = fetch_resource_types()
+    print_payload("Received response from /api/resource-types", result)
+    
+    # Validate the response
+    assert "resource_types" in result, "Response missing resource_types"
+    
+    print("\n✅ /api/resource-types endpoint test passed")
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,77 @@
+"""
+Tests for the configuration utilities
+"""
+import os
+import tempfile
+import unittest
+
+from utils import config
+from utils.config import get_oci_config, load_config
+
+
+class TestLoadConfig(unittest.TestCase):
+    """Test cases for load_config"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.previous_loaded_path = config._LOADED_PATH
+        handle, self.config_path = tempfile.mkstemp(suffix=".yaml")
+        os.close(handle)
+        self.write_config("server:\n  port: 8000\n")
+
+    def tearDown(self):
+        """Remove the temporary config file and restore the loaded config"""
+        os.remove(self.config_path)
+        config._LOADED_PATH = self.previous_loaded_path
+
+    def write_config(self, content, mtime_ns=None):
+        """Write the config file, optionally pinning its modification time"""
+        with open(self.config_path, "w") as config_file:
+            config_file.write(content)
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+
+    def test_load_config_cached(self):
+        """Test that an unchanged file is parsed only once"""
+        first = load_config(self.config_path)
+        second = load_config(self.config_path)
+        
+        self.assertEqual(first, {"server": {"port": 8000}})
+        self.assertIs(first, second)
+
+    def test_load_config_reloads_changed_file(self):
+        """Test that a modified file is parsed again"""
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        load_config(self.config_path)
+        
+        self.write_config("server:\n  port: 9000\n", mtime_ns=mtime_ns + 1)
+        
+        self.assertEqual(load_config(self.config_path), {"server": {"port": 9000}})
+
+    def test_load_config_missing_file(self):
+        """Test that a missing file falls back to the default configuration"""
+        default_config = load_config(self.config_path + ".missing")
+        
+        self.assertEqual(default_config["server"]["port"], 8000)
+        self.assertIn("security", default_config)
+
+    def test_get_oci_config_uses_loaded_config(self):
+        """Test that the OCI section comes from the loaded config"""
+        self.write_config("oci:\n  region: eu-frankfurt-1\n")
+        load_config(self.config_path)
+        
+        self.assertEqual(get_oci_config(), {"region": "eu-frankfurt-1"})
+
+    def test_get_oci_config_reloads_changed_file(self):
+        """Test that the OCI section follows edits to the loaded config file"""
+        self.write_config("oci:\n  region: eu-frankfurt-1\n")
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        load_config(self.config_path)
+        
+        self.write_config("oci:\n  region: us-phoenix-1\n", mtime_ns=mtime_ns + 1)
+        
+        self.assertEqual(get_oci_config(), {"region": "us-phoenix-1"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,441 @@
+"""
+Tests for the OCI Client Service
+"""
+import asyncio
+import datetime
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from services import oci_client
+from services.oci_client import DEFAULT_COMPUTE_SHAPES, OCIClient
+
+TIME_CREATED = datetime.datetime(2023, 10, 25, 12, 34, 56)
+
+DIRECT_OCI_CONFIG = {
+    "tenancy_ocid": "ocid1.tenancy.oc1..example",
+    "region": "us-phoenix-1",
+}
+
+
+def make_client(oci_config=None):
+    """Create an OCIClient with mocked service clients"""
+    with mock.patch.object(oci_client, "get_oci_config", return_value=oci_config or DIRECT_OCI_CONFIG), \
+            mock.patch.object(OCIClient, "_init_clients"):
+        client = OCIClient()
+    
+    client.compute_client = mock.Mock()
+    client.network_client = mock.Mock()
+    client.block_storage_client = mock.Mock()
+    client.database_client = mock.Mock()
+    client.load_balancer_client = mock.Mock()
+    client.object_storage_client = mock.Mock()
+    client.identity_client = mock.Mock()
+    return client
+
+
+def make_response(**attributes):
+    """Create an SDK response whose data has the given attributes"""
+    return mock.Mock(data=mock.Mock(**attributes))
+
+
+class TestOCIClientBlockingCalls(unittest.TestCase):
+    """Test cases for running blocking SDK calls off the event loop"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = make_client()
+
+    def test_run_blocking_uses_oci_executor(self):
+        """Test that blocking calls run on the shared OCI executor with their arguments"""
+        def call(*args, **kwargs):
+            return threading.current_thread().name, args, kwargs
+        
+        thread_name, args, kwargs = asyncio.run(self.client._run_blocking(call, 1, limit=2))
+        
+        self.assertTrue(thread_name.startswith("oci_"))
+        self.assertEqual(args, (1,))
+        self.assertEqual(kwargs, {"limit": 2})
+
+    def test_wait_for_state_uses_wait_executor(self):
+        """Test that lifecycle waits poll on the wait executor"""
+        sdk_client = mock.Mock()
+        get_resource = mock.Mock(return_value="initial response")
+        thread_names = []
+        
+        def wait_until(*args):
+            thread_names.append(threading.current_thread().name)
+            return "final response"
+        
+        with mock.patch("oci.wait_until", side_effect=wait_until) as wait_until_mock:
+            result = asyncio.run(
+                self.client._wait_for_state(sdk_client, get_resource, "ocid1.vcn", "AVAILABLE")
+            )
+        
+        self.assertEqual(result, "final response")
+        get_resource.assert_called_once_with("ocid1.vcn")
+        wait_until_mock.assert_called_once_with(
+            sdk_client, "initial response", "lifecycle_state", "AVAILABLE"
+        )
+        self.assertTrue(thread_names[0].startswith("oci-wait"))
+
+
+class TestOCIClientCreate(unittest.TestCase):
+    """Test cases for the resource create methods"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = make_client()
+        patcher = mock.patch("oci.wait_until")
+        self.wait_until = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_create_vcn(self):
+        """Test that a VCN is created and waited on until available"""
+        self.client.network_client.create_vcn.return_value = make_response(id="ocid1.vcn")
+        self.wait_until.return_value = make_response(
+            id="ocid1.vcn",
+            display_name="Website-VCN",
+            cidr_block="10.0.0.0/16",
+            dns_label="websitevcn",
+            lifecycle_state="AVAILABLE",
+        )
+        
+        vcn = asyncio.run(self.client.create_vcn("ocid1.compartment", "Website-VCN", "10.0.0.0/16"))
+        
+        details = self.client.network_client.create_vcn.call_args[0][0]
+        self.assertEqual(details.dns_label, "websitevcn")
+        self.client.network_client.get_vcn.assert_called_once_with("ocid1.vcn")
+        self.assertEqual(self.wait_until.call_args[0][3], "AVAILABLE")
+        self.assertEqual(vcn["id"], "ocid1.vcn")
+        self.assertEqual(vcn["lifecycle_state"], "AVAILABLE")
+
+    def test_create_subnet_truncates_dns_label(self):
+        """Test that subnet DNS labels are lowercased, unhyphenated and truncated"""
+        self.client.network_client.create_subnet.return_value = make_response(id="ocid1.subnet")
+        self.wait_until.return_value = make_response(id="ocid1.subnet", lifecycle_state="AVAILABLE")
+        
+        asyncio.run(
+            self.client.create_subnet(
+                "ocid1.compartment", "ocid1.vcn", "Web-Server-Subnet-Public", "10.0.0.0/24"
+            )
+        )
+        
+        details = self.client.network_client.create_subnet.call_args[0][0]
+        self.assertEqual(details.dns_label, "webserversubnet")
+        self.assertEqual(len(details.dns_label), oci_client.DNS_LABEL_MAX_LENGTH)
+
+    def test_launch_instance_lists_vnic_attachments_after_running(self):
+        """Test that VNIC attachments are listed once, after the instance is running"""
+        calls = []
+        compute_client = self.client.compute_client
+        compute_client.launch_instance.return_value = make_response(id="ocid1.instance")
+        
+        def wait_until(*args):
+            calls.append("wait")
+            return make_response(
+                id="ocid1.instance",
+                display_name="WebServer",
+                shape="VM.Standard.E4.Flex",
+                lifecycle_state="RUNNING",
+                time_created=TIME_CREATED,
+            )
+        
+        def list_vnic_attachments(**kwargs):
+            calls.append("list")
+            return mock.Mock(data=[mock.Mock(vnic_id="ocid1.vnic")])
+        
+        self.wait_until.side_effect = wait_until
+        compute_client.list_vnic_attachments.side_effect = list_vnic_attachments
+        self.client.network_client.get_vnic.return_value = make_response(
+            public_ip="203.0.113.10", private_ip="10.0.0.2"
+        )
+        
+        instance = asyncio.run(
+            self.client.launch_instance(
+                "ocid1.compartment", "ocid1.subnet", "WebServer", "VM.Standard.E4.Flex", "ocid1.image",
+                ocpus=2, memory_in_gbs=16,
+            )
+        )
+        
+        self.assertEqual(calls, ["wait", "list"])
+        compute_client.list_vnic_attachments.assert_called_once_with(
+            compartment_id="ocid1.compartment", instance_id="ocid1.instance"
+        )
+        self.client.network_client.get_vnic.assert_called_once_with("ocid1.vnic")
+        details = compute_client.launch_instance.call_args[0][0]
+        self.assertEqual(details.shape_config.ocpus, 2)
+        self.assertEqual(instance["public_ip"], "203.0.113.10")
+        self.assertEqual(instance["time_created"], TIME_CREATED.isoformat())
+
+    def test_create_autonomous_database(self):
+        """Test that an Autonomous Database is created and waited on until available"""
+        database_client = self.client.database_client
+        database_client.create_autonomous_database.return_value = make_response(id="ocid1.db")
+        self.wait_until.return_value = make_response(
+            id="ocid1.db",
+            display_name="WebsiteDB",
+            db_name="websitedb",
+            lifecycle_state="AVAILABLE",
+            time_created=TIME_CREATED,
+            connection_strings=mock.Mock(all_connection_strings={"high": "websitedb_high"}),
+        )
+        
+        db = asyncio.run(
+            self.client.create_autonomous_database(
+                "ocid1.compartment", "websitedb", "WebsiteDB", 1, 1, "Password123#"
+            )
+        )
+        
+        database_client.get_autonomous_database.assert_called_once_with("ocid1.db")
+        self.assertEqual(db["connection_strings"], {"high": "websitedb_high"})
+
+    def test_create_block_volume(self):
+        """Test that a block volume is created with its performance setting"""
+        block_storage_client = self.client.block_storage_client
+        block_storage_client.create_volume.return_value = make_response(id="ocid1.volume")
+        self.wait_until.return_value = make_response(
+            id="ocid1.volume",
+            display_name="WebsiteStorage",
+            size_in_gbs=100,
+            lifecycle_state="AVAILABLE",
+            time_created=TIME_CREATED,
+        )
+        
+        volume = asyncio.run(
+            self.client.create_block_volume("ocid1.compartment", "WebsiteStorage", 100, vpus_per_gb=20)
+        )
+        
+        details = block_storage_client.create_volume.call_args[0][0]
+        self.assertEqual(details.vpus_per_gb, 20)
+        self.assertEqual(volume["size_in_gbs"], 100)
+
+    def test_create_load_balancer(self):
+        """Test that the load balancer is fetched from the completed work request"""
+        load_balancer_client = self.client.load_balancer_client
+        load_balancer_client.create_load_balancer.return_value = mock.Mock(
+            headers={"opc-work-request-id": "ocid1.workrequest"}
+        )
+        self.wait_until.return_value = mock.Mock(
+            data=mock.Mock(
+                resources=[
+                    mock.Mock(entity_type="backendset", identifier="backends"),
+                    mock.Mock(entity_type="loadbalancer", identifier="ocid1.lb"),
+                ]
+            )
+        )
+        load_balancer_client.get_load_balancer.return_value = make_response(
+            id="ocid1.lb",
+            display_name="WebsiteLB",
+            shape_name="flexible",
+            ip_addresses=[mock.Mock(ip_address="203.0.113.20")],
+            lifecycle_state="ACTIVE",
+            time_created=TIME_CREATED,
+        )
+        
+        lb = asyncio.run(
+            self.client.create_load_balancer("ocid1.compartment", "WebsiteLB", ["ocid1.subnet"], "flexible")
+        )
+        
+        load_balancer_client.get_work_request.assert_called_once_with("ocid1.workrequest")
+        load_balancer_client.get_load_balancer.assert_called_once_with("ocid1.lb")
+        self.assertEqual(lb["ip_addresses"], ["203.0.113.20"])
+
+    def test_create_load_balancer_without_id(self):
+        """Test that a work request without a load balancer is an error"""
+        self.client.load_balancer_client.create_load_balancer.return_value = mock.Mock(
+            headers={"opc-work-request-id": "ocid1.workrequest"}
+        )
+        self.wait_until.return_value = mock.Mock(data=mock.Mock(resources=[]))
+        
+        with self.assertRaises(Exception):
+            asyncio.run(
+                self.client.create_load_balancer("ocid1.compartment", "WebsiteLB", ["ocid1.subnet"], "flexible")
+            )
+
+    def test_create_bucket(self):
+        """Test that a bucket is created without waiting"""
+        response = make_response(
+            compartment_id="ocid1.compartment",
+            storage_tier="Standard",
+            public_access_type="NoPublicAccess",
+            time_created=TIME_CREATED,
+        )
+        # name is a Mock constructor argument, so it is set separately
+        response.data.name = "website-assets"
+        self.client.object_storage_client.create_bucket.return_value = response
+        
+        bucket = asyncio.run(self.client.create_bucket("ocid1.compartment", "namespace", "website-assets"))
+        
+        self.wait_until.assert_not_called()
+        self.assertEqual(bucket["namespace"], "namespace")
+        self.assertEqual(bucket["name"], "website-assets")
+
+    def test_create_error_is_raised(self):
+        """Test that SDK errors are raised to the caller"""
+        self.client.network_client.create_vcn.side_effect = RuntimeError("quota exceeded")
+        
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.client.create_vcn("ocid1.compartment", "Website-VCN", "10.0.0.0/16"))
+
+
+class TestOCIClientLookups(unittest.TestCase):
+    """Test cases for the cached lookups"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = make_client()
+
+    def test_get_available_resource_types_shared(self):
+        """Test that the resource types are returned without copying"""
+        self.assertIs(
+            self.client.get_available_resource_types(), self.client.get_available_resource_types()
+        )
+
+    def test_get_compute_shapes_cached(self):
+        """Test that shapes are fetched once and returned in field order"""
+        shape = mock.Mock(**{field: field for field in oci_client._SHAPE_FIELDS})
+        self.client.compute_client.list_shapes.return_value = mock.Mock(data=[shape])
+        
+        first = self.client.get_compute_shapes()
+        second = self.client.get_compute_shapes()
+        
+        self.assertIs(first, second)
+        self.assertEqual(list(first[0]), list(oci_client._SHAPE_FIELDS))
+        self.client.compute_client.list_shapes.assert_called_once_with(
+            compartment_id="ocid1.tenancy.oc1..example"
+        )
+
+    def test_get_compute_shapes_refetched(self):
+        """Test that shapes are fetched again once expired or cleared"""
+        self.client.compute_client.list_shapes.return_value = mock.Mock(data=[])
+        
+        with mock.patch.object(oci_client, "COMPUTE_SHAPES_CACHE_TTL_SECONDS", 0):
+            self.client.get_compute_shapes()
+            self.client.get_compute_shapes()
+        self.client.clear_compute_shapes_cache()
+        self.client.get_compute_shapes()
+        
+        self.assertEqual(self.client.compute_client.list_shapes.call_count, 3)
+
+    def test_get_compute_shapes_fallback_not_cached(self):
+        """Test that the fallback shapes are returned but not cached"""
+        self.client.compute_client.list_shapes.side_effect = RuntimeError("unreachable")
+        
+        self.assertIs(self.client.get_compute_shapes(), DEFAULT_COMPUTE_SHAPES)
+        self.assertIs(self.client.get_compute_shapes(), DEFAULT_COMPUTE_SHAPES)
+        
+        self.assertEqual(self.client.compute_client.list_shapes.call_count, 2)
+
+    def test_get_namespace_cached(self):
+        """Test that the namespace is fetched once"""
+        self.client.object_storage_client.get_namespace.return_value = mock.Mock(data="namespace")
+        
+        self.assertEqual(self.client.get_namespace(), "namespace")
+        self.assertEqual(self.client.get_namespace(), "namespace")
+        
+        self.client.object_storage_client.get_namespace.assert_called_once_with()
+
+    def test_warm_up_ignores_errors(self):
+        """Test that every client is called once and failures are not raised"""
+        self.client.network_client.list_vcns.side_effect = RuntimeError("unreachable")
+        
+        self.client.warm_up()
+        
+        for method in (
+            self.client.compute_client.list_shapes,
+            self.client.network_client.list_vcns,
+            self.client.block_storage_client.list_volumes,
+            self.client.database_client.list_autonomous_databases,
+            self.client.load_balancer_client.list_shapes,
+            self.client.object_storage_client.get_namespace,
+            self.client.identity_client.list_regions,
+        ):
+            method.assert_called_once()
+            self.assertIn("retry_strategy", method.call_args.kwargs)
+
+    def test_slots(self):
+        """Test that clients carry no per-instance dictionary"""
+        self.assertFalse(hasattr(self.client, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.client.unknown_attribute = True
+
+
+class TestOCIClientConfig(unittest.TestCase):
+    """Test cases for loading the OCI configuration"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        handle, self.config_path = tempfile.mkstemp()
+        os.close(handle)
+        oci_client._cached_from_file.cache_clear()
+        patcher = mock.patch("oci.config.from_file", side_effect=lambda path, profile: {"region": profile})
+        self.from_file = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Remove the temporary config file"""
+        os.remove(self.config_path)
+        oci_client._cached_from_file.cache_clear()
+
+    def make_client(self):
+        """Create a client reading the temporary config file"""
+        return make_client({"config_file_path": self.config_path, "profile_name": "TEST"})
+
+    def test_config_file_parsed_once(self):
+        """Test that an unchanged config file is parsed once and copied per client"""
+        first = self.make_client()
+        second = self.make_client()
+        
+        self.from_file.assert_called_once_with(self.config_path, "TEST")
+        self.assertEqual(first.config, {"region": "TEST"})
+        self.assertIsNot(first.config, second.config)
+
+    def test_config_file_reparsed_when_changed(self):
+        """Test that a modified config file is parsed again"""
+        self.make_client()
+        
+        with open(self.config_path, "w") as config_file:
+            config_file.write("[TEST]\n")
+        self.make_client()
+        
+        self.assertEqual(self.from_file.call_count, 2)
+
+    def test_direct_config(self):
+        """Test that the direct configuration is used without a config file"""
+        client = make_client()
+        
+        self.assertEqual(client.config["tenancy"], "ocid1.tenancy.oc1..example")
+        self.assertEqual(client.region, "us-phoenix-1")
+
+    def test_init_clients_mounts_sdk_adapter(self):
+        """Test that connection pools are resized with the SDK's vendored adapter"""
+        from oci._vendor.requests.adapters import HTTPAdapter
+        
+        client = make_client()
+        sdk_clients = (
+            "oci.core.ComputeClient",
+            "oci.core.VirtualNetworkClient",
+            "oci.core.BlockstorageClient",
+            "oci.database.DatabaseClient",
+            "oci.load_balancer.LoadBalancerClient",
+            "oci.object_storage.ObjectStorageClient",
+            "oci.identity.IdentityClient",
+        )
+        patchers = [mock.patch(name) for name in sdk_clients]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        client._init_clients()
+        
+        for sdk_client in client._service_clients():
+            scheme, adapter = sdk_client.base_client.session.mount.call_args[0]
+            self.assertEqual(scheme, "https://")
+            self.assertIsInstance(adapter, HTTPAdapter)
+
+
+if __name__ == "__main__":
+    unittest.main()
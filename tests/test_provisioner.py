@@ -0,0 +1,92 @@
+"""
+Tests for the Resource Provisioner
+"""
+import unittest
+from unittest import mock
+
+from api.schemas import OCIResource
+from core.provisioner import ResourceProvisioner
+
+
+def make_resource(name, dependencies=None):
+    """Create a compute resource with the given dependencies"""
+    return OCIResource(
+        resource_type="compute",
+        name=name,
+        specifications={},
+        dependencies=dependencies or [],
+    )
+
+
+class TestResourceProvisioner(unittest.TestCase):
+    """Test cases for the ResourceProvisioner class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.provisioner = ResourceProvisioner(oci_client=mock.Mock(region="us-ashburn-1"))
+
+    def test_sort_resources_by_dependencies(self):
+        """Test that dependencies are ordered before their dependents"""
+        resources = [
+            make_resource("WebsiteStorage", ["WebServer"]),
+            make_resource("WebServer", ["WebsiteVCN"]),
+            make_resource("WebsiteDB", ["WebsiteVCN"]),
+            make_resource("WebsiteVCN"),
+        ]
+        
+        order = [r.name for r in self.provisioner._sort_resources_by_dependencies(resources)]
+        
+        # Verify every resource comes after its dependencies
+        for resource in resources:
+            for dependency in resource.dependencies:
+                self.assertLess(order.index(dependency), order.index(resource.name))
+        self.assertEqual(len(order), len(resources))
+
+    def test_level_resources_by_dependencies(self):
+        """Test that independent resources share a level"""
+        resources = [
+            make_resource("WebServer", ["WebsiteVCN"]),
+            make_resource("WebsiteDB", ["WebsiteVCN"]),
+            make_resource("WebsiteVCN"),
+        ]
+        
+        levels = self.provisioner._level_resources_by_dependencies(resources)
+        
+        self.assertEqual(
+            [sorted(r.name for r in level) for level in levels],
+            [["WebsiteVCN"], ["WebServer", "WebsiteDB"]],
+        )
+
+    def test_sort_resources_ignores_unknown_dependencies(self):
+        """Test that dependencies outside the request are ignored"""
+        resources = [make_resource("WebServer", ["ExistingVCN"])]
+        
+        order = [r.name for r in self.provisioner._sort_resources_by_dependencies(resources)]
+        
+        self.assertEqual(order, ["WebServer"])
+
+    def test_sort_resources_circular_dependency(self):
+        """Test that circular dependencies are rejected"""
+        resources = [
+            make_resource("A", ["B"]),
+            make_resource("B", ["A"]),
+        ]
+        
+        with self.assertRaises(ValueError):
+            self.provisioner._sort_resources_by_dependencies(resources)
+
+    def test_provisioning_requests_evict_least_recently_used(self):
+        """Test that the oldest untouched provisioning requests are evicted"""
+        with mock.patch("core.provisioner.MAX_PROVISIONING_REQUESTS", 2):
+            self.provisioner.provision_resources("first", [])
+            self.provisioner.provision_resources("second", [])
+            self.provisioner.get_provisioning_status("first")
+            self.provisioner.provision_resources("third", [])
+        
+        self.assertEqual(self.provisioner.get_provisioning_status("second")["status"], "not_found")
+        self.assertEqual(self.provisioner.get_provisioning_status("first")["status"], "completed")
+        self.assertEqual(self.provisioner.get_provisioning_status("third")["status"], "completed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for the API Router error handling
+"""
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from api import router
+from api.orjson_response import ORJSONResponse
+
+ORIGIN = "http://localhost:3000"
+
+
+def make_app():
+    """Create an app wired like main.app, without loading config or logging"""
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[ORIGIN],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.include_router(router.router, prefix="/api")
+    return app
+
+
+class TestRouterErrors(unittest.TestCase):
+    """Test cases for errors raised while handling API requests"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.clear_shared_instances()
+        self.addCleanup(self.clear_shared_instances)
+        self.client = TestClient(make_app(), raise_server_exceptions=False)
+
+    @staticmethod
+    def clear_shared_instances():
+        """Forget the shared OCI client and provisioner"""
+        router._shared_oci_client.cache_clear()
+        router.get_provisioner.cache_clear()
+
+    def assert_json_error(self, response, detail_prefix):
+        """Assert a JSON 500 response that the browser is allowed to read"""
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.headers["access-control-allow-origin"], ORIGIN)
+        self.assertTrue(response.json()["detail"].startswith(detail_prefix))
+
+    def test_oci_client_failure_returns_json_500(self):
+        """Test that a failing OCIClient construction is reported as JSON with CORS headers"""
+        with mock.patch.object(router, "OCIClient", side_effect=RuntimeError("missing OCI config")):
+            responses = [
+                self.client.get("/api/resource-types", headers={"Origin": ORIGIN}),
+                self.client.get("/api/compute-shapes", headers={"Origin": ORIGIN}),
+                self.client.get("/api/status/request", headers={"Origin": ORIGIN}),
+                self.client.post(
+                    "/api/provision",
+                    json={"request_id": "request", "confirmed_resources": []},
+                    headers={"Origin": ORIGIN},
+                ),
+            ]
+        
+        for response in responses:
+            with self.subTest(response.url.path):
+                self.assert_json_error(response, "Error initializing OCI client: missing OCI config")
+
+    def test_oci_client_failure_not_cached(self):
+        """Test that the OCI client is created again after a failed attempt"""
+        with mock.patch.object(router, "OCIClient", side_effect=RuntimeError("missing OCI config")):
+            self.client.get("/api/resource-types")
+        
+        with mock.patch.object(router, "OCIClient") as oci_client_class:
+            response = self.client.get("/api/status/request")
+        
+        self.assertEqual(response.status_code, 200)
+        oci_client_class.assert_called_once_with()
+
+    def test_endpoint_failure_returns_json_500(self):
+        """Test that an endpoint error keeps its message and the CORS headers"""
+        analyzer = mock.Mock()
+        analyzer.analyze_requirements.side_effect = ValueError("bad context")
+        app = make_app()
+        app.dependency_overrides[router.get_analyzer] = lambda: analyzer
+        client = TestClient(app, raise_server_exceptions=False)
+        
+        response = client.post(
+            "/api/analyze",
+            json={"request_id": "request", "conversation_context": [{"role": "user", "content": "hi"}]},
+            headers={"Origin": ORIGIN},
+        )
+        
+        self.assert_json_error(response, "Error analyzing requirements: bad context")
+
+
+if __name__ == "__main__":
+    unittest.main()